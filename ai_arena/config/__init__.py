@@ -1,3 +1,3 @@
-from .loader import ConfigLoader, GameConfig
+from .loader import ConfigLoader, GameConfig, get_config, load_config
 
-__all__ = ['ConfigLoader', 'GameConfig']
+__all__ = ['ConfigLoader', 'GameConfig', 'get_config', 'load_config']
@@ -4,10 +4,22 @@ Configuration loader for AI Arena.
 Loads and validates game configuration from config.json.
 """
 
-import json
+import dataclasses
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ai_arena.io import json as _json
+
+_decode_error = _json.JSONDecodeError
+
+# Keep this module's imports to the stdlib and ai_arena.io: tools that only
+# validate config must not pay for numpy or the game engine.
+
+# JSON Schema for config.json: required fields and value types.
+# Range checks stay in _RULES so that every violation is reported at once.
+SCHEMA_PATH = Path(__file__).with_name("schema.json")
 
 
 class ConfigError(Exception):
@@ -15,14 +27,25 @@ class ConfigError(Exception):
     pass
 
 
-@dataclass
+class _SectionError(ConfigError):
+    """Raised by a section's __post_init__; keeps the violated rules for the parser."""
+
+    def __init__(self, section_cls: type, errors: List[Tuple[str, str, Any]]):
+        super().__init__(_format_errors(_error_lines(f"{section_cls.__name__}.", errors)))
+        self.errors = errors
+
+
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Simulation timing parameters."""
     decision_interval_seconds: float
     physics_tick_rate_seconds: float
 
+    def __post_init__(self):
+        _check_section(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShipConfig:
     """Ship base parameters."""
     starting_shields: float
@@ -32,8 +55,11 @@ class ShipConfig:
     base_speed_units_per_second: float
     collision_damage: float
 
+    def __post_init__(self):
+        _check_section(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MovementConfig:
     """Movement AE costs per second."""
     forward_ae_per_second: float
@@ -43,8 +69,11 @@ class MovementConfig:
     backward_diagonal_ae_per_second: float
     stop_ae_per_second: float
 
+    def __post_init__(self):
+        _check_section(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RotationConfig:
     """Rotation parameters and AE costs."""
     none_ae_per_second: float
@@ -53,8 +82,11 @@ class RotationConfig:
     hard_turn_ae_per_second: float
     hard_turn_degrees_per_second: float
 
+    def __post_init__(self):
+        _check_section(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PhaserModeConfig:
     """Configuration for a single phaser mode (wide or focused)."""
     arc_degrees: float
@@ -62,8 +94,11 @@ class PhaserModeConfig:
     damage: float
     cooldown_seconds: float
 
+    def __post_init__(self):
+        _check_section(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PhaserConfig:
     """Phaser weapon configuration."""
     wide: PhaserModeConfig
@@ -71,7 +106,7 @@ class PhaserConfig:
     reconfiguration_time_seconds: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TorpedoConfig:
     """Torpedo weapon configuration."""
     launch_cost_ae: float
@@ -88,18 +123,28 @@ class TorpedoConfig:
     blast_radius_units: float
     blast_damage_multiplier: float
 
+    def __post_init__(self):
+        _check_section(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ArenaConfig:
     """Arena dimensions and spawn configuration."""
     width_units: float
     height_units: float
     spawn_distance_units: float
 
+    def __post_init__(self):
+        _check_section(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameConfig:
-    """Complete game configuration."""
+    """Complete game configuration.
+
+    Frozen, like every section it holds, so one instance can be shared
+    by all matches in a process (see get_config).
+    """
     simulation: SimulationConfig
     ship: ShipConfig
     movement: MovementConfig
@@ -109,290 +154,417 @@ class GameConfig:
     arena: ArenaConfig
 
 
-class ConfigLoader:
-    """Loads and validates game configuration from JSON files."""
+def _parse_section(cls: type, data: Dict, path: str, errors: List[str]) -> Any:
+    """Build a config dataclass from its raw JSON dict.
+
+    Recurses into fields whose type is itself a dataclass. Keys that are
+    not fields of cls are rejected, so a misspelled setting cannot
+    silently fall back to its default. Range checks run once, in each
+    section's __post_init__; their violations are collected here instead
+    of stopping at the first section that fails.
+
+    Args:
+        cls: Config dataclass to build
+        data: Raw JSON object for this section
+        path: Dotted path of the section ("" for the top level)
+        errors: List that violated rules are appended to, by dotted path
+
+    Returns:
+        Instance of cls, or None if it or a nested section violated a rule
+
+    Raises:
+        KeyError: If a field is missing (the key names the field)
+        ConfigError: If data contains keys that are not fields of cls
+    """
+    fields = dataclasses.fields(cls)
+    unknown = data.keys() - {f.name for f in fields}
+    if unknown:
+        raise ConfigError(
+            f"Invalid configuration: unknown field(s) in {path or 'config'}: "
+            f"{', '.join(sorted(unknown))}"
+        )
+
+    errors_before = len(errors)
+    values = {}
+    for f in fields:
+        value = data[f.name]
+        if dataclasses.is_dataclass(f.type):
+            value = _parse_section(f.type, value, f"{path}.{f.name}" if path else f.name, errors)
+        values[f.name] = value
+
+    if len(errors) > errors_before:
+        # A nested section failed, so this one cannot be built
+        return None
+    try:
+        return cls(**values)
+    except _SectionError as e:
+        errors.extend(_error_lines(f"{path}." if path else "", e.errors))
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_validator() -> Optional[Callable[[Dict], Any]]:
+    """Compile the config JSON Schema into a validator, once per process.
+
+    Returns:
+        Compiled validator function, or None if fastjsonschema is not
+        installed (missing fields are then still caught by the parser)
+    """
+    try:
+        # Imported lazily: only needed on a cache-miss load
+        import fastjsonschema
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return fastjsonschema.compile(_json.loads(SCHEMA_PATH.read_bytes()))
+
+
+def _positive(value: float) -> bool:
+    return value > 0
+
+
+def _non_negative(value: float) -> bool:
+    return value >= 0
+
+
+def _valid_arc(value: float) -> bool:
+    return 0 < value <= 360
+
+
+_GT_ZERO = "must be > 0"
+_GE_ZERO = "must be >= 0"
+_ARC = "must be > 0 and <= 360"
+
+# Single-field validation rules: (dotted path, predicate, message).
+# Checked by each section's __post_init__ (see _check_section).
+_RULES: Tuple[Tuple[str, Callable[[float], bool], str], ...] = (
+    # Simulation
+    ("simulation.decision_interval_seconds", _positive, _GT_ZERO),
+    ("simulation.physics_tick_rate_seconds", _positive, _GT_ZERO),
+    # Ship
+    ("ship.starting_shields", _positive, _GT_ZERO),
+    ("ship.starting_ae", _positive, _GT_ZERO),
+    ("ship.ae_regen_per_second", _non_negative, _GE_ZERO),
+    ("ship.base_speed_units_per_second", _positive, _GT_ZERO),
+    ("ship.collision_damage", _non_negative, _GE_ZERO),
+    # Movement
+    ("movement.forward_ae_per_second", _non_negative, _GE_ZERO),
+    ("movement.stop_ae_per_second", _non_negative, _GE_ZERO),
+    # Rotation
+    ("rotation.soft_turn_degrees_per_second", _non_negative, _GE_ZERO),
+    ("rotation.hard_turn_degrees_per_second", _non_negative, _GE_ZERO),
+    # Phaser (wide)
+    ("phaser.wide.arc_degrees", _valid_arc, _ARC),
+    ("phaser.wide.range_units", _positive, _GT_ZERO),
+    ("phaser.wide.damage", _positive, _GT_ZERO),
+    ("phaser.wide.cooldown_seconds", _non_negative, _GE_ZERO),
+    # Phaser (focused)
+    ("phaser.focused.arc_degrees", _valid_arc, _ARC),
+    ("phaser.focused.range_units", _positive, _GT_ZERO),
+    ("phaser.focused.damage", _positive, _GT_ZERO),
+    ("phaser.focused.cooldown_seconds", _non_negative, _GE_ZERO),
+    # Torpedo
+    ("torpedo.launch_cost_ae", _positive, _GT_ZERO),
+    ("torpedo.max_ae_capacity", _positive, _GT_ZERO),
+    ("torpedo.speed_units_per_second", _positive, _GT_ZERO),
+    ("torpedo.max_active_per_ship", _positive, _GT_ZERO),
+    ("torpedo.blast_radius_units", _positive, _GT_ZERO),
+    ("torpedo.blast_damage_multiplier", _positive, _GT_ZERO),
+    ("torpedo.blast_expansion_seconds", _positive, _GT_ZERO),
+    ("torpedo.blast_persistence_seconds", _positive, _GT_ZERO),
+    ("torpedo.blast_dissipation_seconds", _positive, _GT_ZERO),
+    # Arena
+    ("arena.width_units", _positive, _GT_ZERO),
+    ("arena.height_units", _positive, _GT_ZERO),
+    ("arena.spawn_distance_units", _positive, _GT_ZERO),
+)
+
+# Rules comparing two fields of one section:
+# (dotted path, section predicate, message, section -> reported value).
+_CROSS_RULES: Tuple[Tuple[str, Callable[[Any], bool], str, Callable[[Any], str]], ...] = (
+    (
+        "simulation.physics_tick_rate_seconds",
+        lambda s: s.physics_tick_rate_seconds <= s.decision_interval_seconds,
+        "must be <= decision_interval_seconds",
+        lambda s: f"{s.physics_tick_rate_seconds} > {s.decision_interval_seconds}",
+    ),
+    (
+        "ship.max_ae",
+        lambda s: s.max_ae >= s.starting_ae,
+        "must be >= starting_ae",
+        lambda s: f"{s.max_ae} < {s.starting_ae}",
+    ),
+    (
+        "arena.spawn_distance_units",
+        lambda s: s.spawn_distance_units <= s.width_units,
+        "must be <= width_units",
+        lambda s: f"{s.spawn_distance_units} > {s.width_units}",
+    ),
+)
+
+def _resolve_rule_path(path: str) -> Tuple[type, str]:
+    """Map a dotted rule path to the config class and field it checks."""
+    *sections, name = path.split(".")
+    cls = GameConfig
+    for section in sections:
+        cls = {f.name: f.type for f in dataclasses.fields(cls)}[section]
+    return cls, name
+
+
+@functools.lru_cache(maxsize=None)
+def _section_rules(cls: type) -> Tuple[List[Tuple], List[Tuple]]:
+    """Select the _RULES and _CROSS_RULES entries that apply to a section class.
+
+    Sections that appear at several paths (phaser.wide, phaser.focused)
+    share one set of rules.
+
+    Args:
+        cls: Config section dataclass
+
+    Returns:
+        Tuple of (single-field rules as (field, predicate, message),
+        cross-field rules as (field, predicate, message, got))
+    """
+    rules = []
+    for path, ok, message in _RULES:
+        rule_cls, name = _resolve_rule_path(path)
+        if rule_cls is cls and (name, ok, message) not in rules:
+            rules.append((name, ok, message))
+
+    cross_rules = []
+    for path, ok, message, got in _CROSS_RULES:
+        rule_cls, name = _resolve_rule_path(path)
+        if rule_cls is cls:
+            cross_rules.append((name, ok, message, got))
+
+    return rules, cross_rules
+
+
+def _section_errors(cls: type, section: Any) -> List[Tuple[str, str, Any]]:
+    """Check one config section against its rules.
+
+    Args:
+        cls: Config section dataclass whose rules apply
+        section: Object with the section's fields as attributes
+
+    Returns:
+        List of (field, message, reported value), empty if all rules pass
+    """
+    rules, cross_rules = _section_rules(cls)
+    errors = []
+    for name, ok, message in rules:
+        value = getattr(section, name)
+        if not ok(value):
+            errors.append((name, message, value))
+    for name, ok, message, got in cross_rules:
+        if not ok(section):
+            errors.append((name, message, got(section)))
+    return errors
+
+
+def _error_lines(prefix: str, errors: List[Tuple[str, str, Any]]) -> List[str]:
+    return [f"{prefix}{name} {message} (got: {value})" for name, message, value in errors]
+
+
+def _format_errors(lines: List[str]) -> str:
+    return "Invalid configuration:\n" + "\n".join(f"  - {line}" for line in lines)
+
+
+def _check_section(section: Any):
+    """Raise ConfigError listing every rule a section violates (__post_init__ hook)."""
+    errors = _section_errors(type(section), section)
+    if errors:
+        raise _SectionError(type(section), errors)
+
+
+def load_config(filepath: str = "config.json") -> GameConfig:
+    """
+    Load configuration from a JSON file.
+
+    Args:
+        filepath: Path to the configuration file (relative to project root)
+
+    Returns:
+        GameConfig object with all configuration data
+
+    Raises:
+        ConfigError: If file cannot be loaded or config is invalid
+
+    Note:
+        Results are cached per resolved path and modification time, so
+        repeated loads of an unchanged file return the same GameConfig
+        instance. Treat the returned config as read-only.
+    """
+    try:
+        # Resolve so different spellings of the same path share a cache entry
+        config_path = Path(filepath).resolve()
+        mtime_ns = config_path.stat().st_mtime_ns
+
+        return _load_cached(str(config_path), mtime_ns)
+
+    except FileNotFoundError as e:
+        raise ConfigError(
+            f"Configuration file not found: {filepath}\n"
+            f"Please ensure config.json exists in the project root."
+        ) from e
+    except _decode_error as e:
+        raise ConfigError(
+            f"Invalid JSON in configuration file: {filepath}\n"
+            f"Error at line {e.lineno}, column {e.colno}: {e.msg}"
+        ) from e
+    except (KeyError, TypeError) as e:
+        raise ConfigError(
+            f"Invalid configuration structure: {e}\n"
+            f"Please ensure all required fields are present."
+        ) from e
+
+
+def _check_schema(data: Dict):
+    """
+    Check raw JSON data against the config schema.
+
+    Args:
+        data: Raw configuration dict as decoded from JSON
+
+    Raises:
+        ConfigError: If a required field is missing or has the wrong type
+    """
+    validate = _schema_validator()
+    if validate is None:
+        return
+
+    from fastjsonschema import JsonSchemaValueException
+
+    try:
+        validate(data)
+    except JsonSchemaValueException as e:
+        section = e.name.partition(".")[2] or "config"
+        if e.rule == "required":
+            missing = ", ".join(k for k in e.rule_definition if k not in e.value)
+            raise ConfigError(
+                f"Invalid configuration: missing required field(s) in {section}: {missing}"
+            ) from e
+        raise ConfigError(
+            f"Invalid configuration value type: {section} must be {e.rule_definition} "
+            f"(got: {e.value!r})"
+        ) from e
 
-    def load(self, filepath: str = "config.json") -> GameConfig:
-        """
-        Load configuration from a JSON file.
 
-        Args:
-            filepath: Path to the configuration file (relative to project root)
+def _parse_config(data: Dict) -> GameConfig:
+    """
+    Parse raw JSON data into a typed, validated GameConfig object.
 
-        Returns:
-            GameConfig object with all configuration data
+    Every section checks itself as it is built; the violations are
+    gathered and raised together once the whole file has been walked.
 
-        Raises:
-            ConfigError: If file cannot be loaded or config is invalid
-        """
-        try:
-            # Convert to Path object for easier handling
-            config_path = Path(filepath)
+    Raises:
+        ConfigError: If a field is missing or unknown, or any value is out of range
+    """
+    errors = []
+    try:
+        config = _parse_section(GameConfig, data, "", errors)
+    except KeyError as e:
+        raise ConfigError(f"Invalid configuration: missing required field {e}")
+    except TypeError as e:
+        raise ConfigError(f"Invalid configuration value type: {e}")
 
-            # Read the JSON file
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+    if errors:
+        raise ConfigError(_format_errors(errors))
+    return config
 
-            # Parse into typed dataclasses
-            config = self._parse_config(data)
 
-            # Validate configuration values
-            self._validate(config)
+def _validate_config(config: GameConfig):
+    """
+    Validate configuration values.
 
-            return config
+    Re-runs every section's range and consistency checks on an existing
+    config. Configs produced by _parse_config have already passed them.
 
-        except FileNotFoundError as e:
-            raise ConfigError(
-                f"Configuration file not found: {filepath}\n"
-                f"Please ensure config.json exists in the project root."
-            ) from e
-        except json.JSONDecodeError as e:
-            raise ConfigError(
-                f"Invalid JSON in configuration file: {filepath}\n"
-                f"Error at line {e.lineno}, column {e.colno}: {e.msg}"
-            ) from e
-        except (KeyError, TypeError) as e:
-            raise ConfigError(
-                f"Invalid configuration structure: {e}\n"
-                f"Please ensure all required fields are present."
-            ) from e
+    Args:
+        config: GameConfig object to validate
+
+    Raises:
+        ConfigError: If any validation rules are violated
+    """
+    errors = []
+    for path, section in _iter_sections(config):
+        errors.extend(_error_lines(f"{path}.", _section_errors(type(section), section)))
+
+    if errors:
+        raise ConfigError(_format_errors(errors))
+
+
+def _iter_sections(config: Any, prefix: str = ""):
+    """Yield (dotted path, section) for every nested config section, depth first."""
+    for f in dataclasses.fields(config):
+        value = getattr(config, f.name)
+        if dataclasses.is_dataclass(value):
+            path = f"{prefix}{f.name}"
+            yield from _iter_sections(value, path + ".")
+            yield path, value
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(abs_path: str, mtime_ns: int) -> GameConfig:
+    """Read, parse and validate a config file.
+
+    The modification time is part of the cache key so that editing the
+    file on disk invalidates the cached entry. Failed loads raise and are
+    therefore never cached.
+
+    Args:
+        abs_path: Resolved path to the configuration file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+
+    Returns:
+        Validated GameConfig object
+    """
+    # Read the JSON file (orjson only accepts bytes)
+    with open(abs_path, 'rb') as f:
+        data = _json.loads(f.read())
+
+    # Check required fields and value types
+    _check_schema(data)
+
+    # Parse into typed dataclasses; each section validates itself
+    return _parse_config(data)
+
+
+def get_config(filepath: str = "config.json") -> GameConfig:
+    """
+    Return the process-wide GameConfig for a configuration file.
+
+    The file is loaded and validated on the first call for its resolved
+    path; later calls return the same instance without touching the
+    filesystem, and the file is never reloaded, even if it changes. Use
+    load_config() directly when edits to the file must be picked up.
+
+    Args:
+        filepath: Path to the configuration file (relative to project root)
+
+    Returns:
+        Shared, immutable GameConfig object
+
+    Raises:
+        ConfigError: If file cannot be loaded or config is invalid
+    """
+    # Resolve now so that every spelling of a path, from any working
+    # directory, maps to one shared instance
+    return _shared_config(str(Path(filepath).resolve()))
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_config(abs_path: str) -> GameConfig:
+    return load_config(abs_path)
+
+
+class ConfigLoader:
+    """Loads and validates game configuration from JSON files.
+
+    Deprecated: a stateless shim kept for existing callers. Use
+    load_config() or get_config() instead.
+    """
 
-    def _parse_config(self, data: Dict) -> GameConfig:
-        """Parse raw JSON data into typed GameConfig object."""
-        try:
-            # Parse simulation config
-            simulation = SimulationConfig(**data['simulation'])
-
-            # Parse ship config
-            ship = ShipConfig(**data['ship'])
-
-            # Parse movement config
-            movement = MovementConfig(**data['movement'])
-
-            # Parse rotation config
-            rotation = RotationConfig(**data['rotation'])
-
-            # Parse phaser config (nested structure)
-            phaser_data = data['phaser']
-            phaser = PhaserConfig(
-                wide=PhaserModeConfig(**phaser_data['wide']),
-                focused=PhaserModeConfig(**phaser_data['focused']),
-                reconfiguration_time_seconds=phaser_data['reconfiguration_time_seconds']
-            )
-
-            # Parse torpedo config
-            torpedo = TorpedoConfig(**data['torpedo'])
-
-            # Parse arena config
-            arena = ArenaConfig(**data['arena'])
-
-            # Combine into GameConfig
-            return GameConfig(
-                simulation=simulation,
-                ship=ship,
-                movement=movement,
-                rotation=rotation,
-                phaser=phaser,
-                torpedo=torpedo,
-                arena=arena
-            )
-        except KeyError as e:
-            raise ConfigError(f"Missing required configuration field: {e}")
-        except TypeError as e:
-            raise ConfigError(f"Invalid configuration value type: {e}")
-
-    def _validate(self, config: GameConfig):
-        """
-        Validate configuration values.
-
-        Checks that all values are within acceptable ranges and logically consistent.
-
-        Args:
-            config: GameConfig object to validate
-
-        Raises:
-            ConfigError: If any validation rules are violated
-        """
-        errors = []
-
-        # Simulation validation
-        if config.simulation.decision_interval_seconds <= 0:
-            errors.append(
-                f"simulation.decision_interval_seconds must be > 0 "
-                f"(got: {config.simulation.decision_interval_seconds})"
-            )
-        if config.simulation.physics_tick_rate_seconds <= 0:
-            errors.append(
-                f"simulation.physics_tick_rate_seconds must be > 0 "
-                f"(got: {config.simulation.physics_tick_rate_seconds})"
-            )
-        if config.simulation.physics_tick_rate_seconds > config.simulation.decision_interval_seconds:
-            errors.append(
-                f"simulation.physics_tick_rate_seconds must be <= decision_interval_seconds "
-                f"(got: {config.simulation.physics_tick_rate_seconds} > {config.simulation.decision_interval_seconds})"
-            )
-
-        # Ship validation
-        if config.ship.starting_shields <= 0:
-            errors.append(
-                f"ship.starting_shields must be > 0 (got: {config.ship.starting_shields})"
-            )
-        if config.ship.starting_ae <= 0:
-            errors.append(
-                f"ship.starting_ae must be > 0 (got: {config.ship.starting_ae})"
-            )
-        if config.ship.max_ae < config.ship.starting_ae:
-            errors.append(
-                f"ship.max_ae must be >= starting_ae "
-                f"(got: {config.ship.max_ae} < {config.ship.starting_ae})"
-            )
-        if config.ship.ae_regen_per_second < 0:
-            errors.append(
-                f"ship.ae_regen_per_second must be >= 0 (got: {config.ship.ae_regen_per_second})"
-            )
-        if config.ship.base_speed_units_per_second <= 0:
-            errors.append(
-                f"ship.base_speed_units_per_second must be > 0 "
-                f"(got: {config.ship.base_speed_units_per_second})"
-            )
-        if config.ship.collision_damage < 0:
-            errors.append(
-                f"ship.collision_damage must be >= 0 (got: {config.ship.collision_damage})"
-            )
-
-        # Movement validation
-        if config.movement.forward_ae_per_second < 0:
-            errors.append(
-                f"movement.forward_ae_per_second must be >= 0 "
-                f"(got: {config.movement.forward_ae_per_second})"
-            )
-        if config.movement.stop_ae_per_second < 0:
-            errors.append(
-                f"movement.stop_ae_per_second must be >= 0 "
-                f"(got: {config.movement.stop_ae_per_second})"
-            )
-
-        # Rotation validation
-        if config.rotation.soft_turn_degrees_per_second < 0:
-            errors.append(
-                f"rotation.soft_turn_degrees_per_second must be >= 0 "
-                f"(got: {config.rotation.soft_turn_degrees_per_second})"
-            )
-        if config.rotation.hard_turn_degrees_per_second < 0:
-            errors.append(
-                f"rotation.hard_turn_degrees_per_second must be >= 0 "
-                f"(got: {config.rotation.hard_turn_degrees_per_second})"
-            )
-
-        # Phaser validation (wide)
-        if config.phaser.wide.arc_degrees <= 0 or config.phaser.wide.arc_degrees > 360:
-            errors.append(
-                f"phaser.wide.arc_degrees must be > 0 and <= 360 "
-                f"(got: {config.phaser.wide.arc_degrees})"
-            )
-        if config.phaser.wide.range_units <= 0:
-            errors.append(
-                f"phaser.wide.range_units must be > 0 (got: {config.phaser.wide.range_units})"
-            )
-        if config.phaser.wide.damage <= 0:
-            errors.append(
-                f"phaser.wide.damage must be > 0 (got: {config.phaser.wide.damage})"
-            )
-        if config.phaser.wide.cooldown_seconds < 0:
-            errors.append(
-                f"phaser.wide.cooldown_seconds must be >= 0 "
-                f"(got: {config.phaser.wide.cooldown_seconds})"
-            )
-
-        # Phaser validation (focused)
-        if config.phaser.focused.arc_degrees <= 0 or config.phaser.focused.arc_degrees > 360:
-            errors.append(
-                f"phaser.focused.arc_degrees must be > 0 and <= 360 "
-                f"(got: {config.phaser.focused.arc_degrees})"
-            )
-        if config.phaser.focused.range_units <= 0:
-            errors.append(
-                f"phaser.focused.range_units must be > 0 "
-                f"(got: {config.phaser.focused.range_units})"
-            )
-        if config.phaser.focused.damage <= 0:
-            errors.append(
-                f"phaser.focused.damage must be > 0 (got: {config.phaser.focused.damage})"
-            )
-        if config.phaser.focused.cooldown_seconds < 0:
-            errors.append(
-                f"phaser.focused.cooldown_seconds must be >= 0 "
-                f"(got: {config.phaser.focused.cooldown_seconds})"
-            )
-
-        # Torpedo validation
-        if config.torpedo.launch_cost_ae <= 0:
-            errors.append(
-                f"torpedo.launch_cost_ae must be > 0 (got: {config.torpedo.launch_cost_ae})"
-            )
-        if config.torpedo.max_ae_capacity <= 0:
-            errors.append(
-                f"torpedo.max_ae_capacity must be > 0 (got: {config.torpedo.max_ae_capacity})"
-            )
-        if config.torpedo.speed_units_per_second <= 0:
-            errors.append(
-                f"torpedo.speed_units_per_second must be > 0 "
-                f"(got: {config.torpedo.speed_units_per_second})"
-            )
-        if config.torpedo.max_active_per_ship <= 0:
-            errors.append(
-                f"torpedo.max_active_per_ship must be > 0 "
-                f"(got: {config.torpedo.max_active_per_ship})"
-            )
-        if config.torpedo.blast_radius_units <= 0:
-            errors.append(
-                f"torpedo.blast_radius_units must be > 0 "
-                f"(got: {config.torpedo.blast_radius_units})"
-            )
-        if config.torpedo.blast_damage_multiplier <= 0:
-            errors.append(
-                f"torpedo.blast_damage_multiplier must be > 0 "
-                f"(got: {config.torpedo.blast_damage_multiplier})"
-            )
-        if config.torpedo.blast_expansion_seconds <= 0:
-            errors.append(
-                f"torpedo.blast_expansion_seconds must be > 0 "
-                f"(got: {config.torpedo.blast_expansion_seconds})"
-            )
-        if config.torpedo.blast_persistence_seconds <= 0:
-            errors.append(
-                f"torpedo.blast_persistence_seconds must be > 0 "
-                f"(got: {config.torpedo.blast_persistence_seconds})"
-            )
-        if config.torpedo.blast_dissipation_seconds <= 0:
-            errors.append(
-                f"torpedo.blast_dissipation_seconds must be > 0 "
-                f"(got: {config.torpedo.blast_dissipation_seconds})"
-            )
-
-        # Arena validation
-        if config.arena.width_units <= 0:
-            errors.append(
-                f"arena.width_units must be > 0 (got: {config.arena.width_units})"
-            )
-        if config.arena.height_units <= 0:
-            errors.append(
-                f"arena.height_units must be > 0 (got: {config.arena.height_units})"
-            )
-        if config.arena.spawn_distance_units <= 0:
-            errors.append(
-                f"arena.spawn_distance_units must be > 0 "
-                f"(got: {config.arena.spawn_distance_units})"
-            )
-
-        # Logical consistency checks
-        if config.arena.spawn_distance_units > config.arena.width_units:
-            errors.append(
-                f"arena.spawn_distance_units must be <= width_units "
-                f"(got: {config.arena.spawn_distance_units} > {config.arena.width_units})"
-            )
-
-        # Raise error if any validation failed
-        if errors:
-            error_msg = "Invalid configuration:\n" + "\n".join(f"  - {e}" for e in errors)
-            raise ConfigError(error_msg)
+    load = staticmethod(load_config)
+    _check_schema = staticmethod(_check_schema)
+    _parse_config = staticmethod(_parse_config)
+    _validate = staticmethod(_validate_config)
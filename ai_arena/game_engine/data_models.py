@@ -1,13 +1,19 @@
 from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Optional
 from enum import Enum
-import numpy as np
+import math
 
 # ============= Data Structures =============
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Vec2D:
-    """2D vector for positions and velocities."""
+    """2D vector for positions and velocities.
+
+    Slotted: allocated for every position/velocity update, so the
+    per-instance __dict__ is dropped to keep instances small. Frozen: a
+    position or velocity is changed by assigning a new Vec2D, so instances
+    can be shared between states instead of copied.
+    """
     x: float = 0.0
     y: float = 0.0
     
@@ -21,7 +27,7 @@ class Vec2D:
         return Vec2D(self.x * scalar, self.y * scalar)
     
     def magnitude(self) -> float:
-        return np.sqrt(self.x**2 + self.y**2)
+        return math.hypot(self.x, self.y)
     
     def normalized(self) -> 'Vec2D':
         mag = self.magnitude()
@@ -30,7 +36,13 @@ class Vec2D:
         return Vec2D(self.x / mag, self.y / mag)
     
     def distance_to(self, other: 'Vec2D') -> float:
-        return (self - other).magnitude()
+        return math.hypot(self.x - other.x, self.y - other.y)
+    
+    def distance_sq_to(self, other: 'Vec2D') -> float:
+        """Squared distance; compare against radius**2 to skip the sqrt."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
     
     def to_tuple(self) -> Tuple[float, float]:
         return (self.x, self.y)
@@ -67,13 +79,54 @@ class PhaserConfig(Enum):
     WIDE = "WIDE"
     FOCUSED = "FOCUSED"
 
+# Direct value -> member maps; skips Enum.__call__'s lookup machinery
+_MOVEMENT_BY_VALUE = MovementDirection._value2member_map_
+_ROTATION_BY_VALUE = RotationCommand._value2member_map_
+_PHASER_BY_VALUE = PhaserConfig._value2member_map_
+
+MOVEMENT_VALUES = frozenset(_MOVEMENT_BY_VALUE)
+ROTATION_VALUES = frozenset(_ROTATION_BY_VALUE)
+
+def parse_movement(value: str) -> MovementDirection:
+    """Look up a MovementDirection by its string value.
+
+    Raises:
+        ValueError: If value is not a valid movement direction
+    """
+    movement = _MOVEMENT_BY_VALUE.get(value)
+    if movement is None:
+        raise ValueError(f"Invalid movement direction: {value!r}")
+    return movement
+
+def parse_rotation(value: str) -> RotationCommand:
+    """Look up a RotationCommand by its string value.
+
+    Raises:
+        ValueError: If value is not a valid rotation command
+    """
+    rotation = _ROTATION_BY_VALUE.get(value)
+    if rotation is None:
+        raise ValueError(f"Invalid rotation command: {value!r}")
+    return rotation
+
+def parse_phaser_config(value: str) -> PhaserConfig:
+    """Look up a PhaserConfig by its string value.
+
+    Raises:
+        ValueError: If value is not a valid phaser configuration
+    """
+    config = _PHASER_BY_VALUE.get(value)
+    if config is None:
+        raise ValueError(f"Invalid phaser config: {value!r}")
+    return config
+
 class BlastZonePhase(Enum):
     """Lifecycle phase for blast zones."""
     EXPANSION = "expansion"       # Growing from 0→15 units
     PERSISTENCE = "persistence"   # Holding at 15 units
     DISSIPATION = "dissipation"   # Shrinking from 15→0 units
 
-@dataclass
+@dataclass(slots=True)
 class ShipState:
     """Complete state for one ship."""
     position: Vec2D
@@ -92,7 +145,20 @@ class ShipState:
                 f"phaser_cooldown_remaining must be >= 0.0, got {self.phaser_cooldown_remaining}"
             )
 
-@dataclass
+    def clone(self) -> 'ShipState':
+        """Independent copy; skips __init__ since the source is already valid."""
+        new = object.__new__(ShipState)
+        new.position = self.position
+        new.velocity = self.velocity
+        new.heading = self.heading
+        new.shields = self.shields
+        new.ae = self.ae
+        new.phaser_config = self.phaser_config
+        new.reconfiguring_phaser = self.reconfiguring_phaser
+        new.phaser_cooldown_remaining = self.phaser_cooldown_remaining
+        return new
+
+@dataclass(slots=True)
 class TorpedoState:
     """Complete state for one torpedo."""
     id: str
@@ -104,7 +170,20 @@ class TorpedoState:
     just_launched: bool = False
     detonation_timer: Optional[float] = None  # Seconds until timed detonation
 
-@dataclass
+    def clone(self) -> 'TorpedoState':
+        """Independent copy; skips __init__ since the source is already valid."""
+        new = object.__new__(TorpedoState)
+        new.id = self.id
+        new.position = self.position
+        new.velocity = self.velocity
+        new.heading = self.heading
+        new.ae_remaining = self.ae_remaining
+        new.owner = self.owner
+        new.just_launched = self.just_launched
+        new.detonation_timer = self.detonation_timer
+        return new
+
+@dataclass(slots=True)
 class BlastZone:
     """Persistent area of damage from torpedo detonation.
 
@@ -127,7 +206,19 @@ class BlastZone:
     current_radius: float
     owner: str
 
-@dataclass
+    def clone(self) -> 'BlastZone':
+        """Independent copy; skips __init__ since the source is already valid."""
+        new = object.__new__(BlastZone)
+        new.id = self.id
+        new.position = self.position
+        new.base_damage = self.base_damage
+        new.phase = self.phase
+        new.age = self.age
+        new.current_radius = self.current_radius
+        new.owner = self.owner
+        return new
+
+@dataclass(slots=True)
 class GameState:
     """Complete game state at a single point in time."""
     turn: int
@@ -136,7 +227,17 @@ class GameState:
     torpedoes: List[TorpedoState] = field(default_factory=list)
     blast_zones: List[BlastZone] = field(default_factory=list)
 
-@dataclass
+    def clone(self) -> 'GameState':
+        """Deep copy of ships, torpedoes and blast zones; Vec2Ds are shared."""
+        new = object.__new__(GameState)
+        new.turn = self.turn
+        new.ship_a = self.ship_a.clone()
+        new.ship_b = self.ship_b.clone()
+        new.torpedoes = [t.clone() for t in self.torpedoes]
+        new.blast_zones = [bz.clone() for bz in self.blast_zones]
+        return new
+
+@dataclass(slots=True)
 class Orders:
     """Commands from LLM for one ship.
 
@@ -151,14 +252,14 @@ class Orders:
     weapon_action: str
     torpedo_orders: Dict[str, str] = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
     """Something that happened during a turn."""
     type: str
     turn: int
     data: dict
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchConfig:
     model_a: str
     model_b: str
@@ -166,7 +267,7 @@ class MatchConfig:
     initial_ae: int = 100
     initial_shields: int = 100
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     match_id: str
     winner: str
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+import math
 import numpy as np
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
+TWO_PI = 2 * math.pi
+
 from ai_arena.game_engine.data_models import (
     GameState, Orders, Event, ShipState, TorpedoState, Vec2D,
     MovementDirection, RotationCommand, PhaserConfig,
@@ -16,6 +19,36 @@ from ai_arena.config import GameConfig
 
 # ============= Core Engine =============
 
+@dataclass(slots=True)
+class _TorpedoPaths:
+    """Per-substep kinematics for the torpedoes in flight during one turn.
+
+    Struct-of-arrays layout: row i belongs to torpedoes[i] and column k holds
+    its state after substep k. Timers are NaN for torpedoes without a timed
+    detonation. Headings are unwrapped; apply() wraps the one it writes.
+    """
+    torpedoes: List[TorpedoState]
+    x: np.ndarray
+    y: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+    heading: np.ndarray
+    ae: np.ndarray
+    timer: np.ndarray
+    detonations: Dict[int, List[int]]  # substep -> rows detonating there
+
+    def apply(self, row: int, step: int) -> TorpedoState:
+        """Write the state after a substep back onto a torpedo."""
+        torpedo = self.torpedoes[row]
+        torpedo.position = Vec2D(float(self.x[row, step]), float(self.y[row, step]))
+        torpedo.velocity = Vec2D(float(self.vx[row, step]), float(self.vy[row, step]))
+        torpedo.heading = float(self.heading[row, step]) % TWO_PI
+        torpedo.ae_remaining = float(self.ae[row, step])
+        if torpedo.detonation_timer is not None:
+            torpedo.detonation_timer = float(self.timer[row, step])
+        return torpedo
+
+
 class PhysicsEngine:
     """
     Configuration-driven physics engine.
@@ -25,14 +58,18 @@ class PhysicsEngine:
     single source of truth and easy balance tuning.
     """
 
-    def __init__(self, config: GameConfig):
+    def __init__(self, config: GameConfig, use_analytic: bool = True):
         """
         Initialize physics engine with game configuration.
 
         Args:
             config: GameConfig object containing all game parameters
+            use_analytic: Integrate ship motion for the whole action phase at
+                once (default). False steps ships through every substep with
+                _update_ship_physics; kept for determinism testing.
         """
         self.config = config
+        self.use_analytic = use_analytic
 
         # Compute derived simulation values
         self.fixed_timestep = config.simulation.physics_tick_rate_seconds
@@ -42,19 +79,22 @@ class PhysicsEngine:
         # Cache frequently used values
         self.ship_speed = config.ship.base_speed_units_per_second
         self.torpedo_speed = config.torpedo.speed_units_per_second
+        self.torpedo_burn_per_second = config.torpedo.ae_burn_straight_per_second
+        self.ship_max_ae = config.ship.max_ae
+        self.ae_regen_per_second = config.ship.ae_regen_per_second
 
         # Movement direction offsets (relative to current heading)
         # Used for independent movement system (Story 005)
         # Convention: heading 0 = East (+X), positive angles = counterclockwise
         self.MOVEMENT_DIRECTION_OFFSETS = {
             MovementDirection.FORWARD: 0.0,              # 0° - Straight ahead
-            MovementDirection.FORWARD_LEFT: np.pi/4,     # +45° - Diagonal left (counterclockwise)
-            MovementDirection.FORWARD_RIGHT: -np.pi/4,   # -45° - Diagonal right (clockwise)
-            MovementDirection.LEFT: np.pi/2,             # +90° - Perpendicular left (counterclockwise)
-            MovementDirection.RIGHT: -np.pi/2,           # -90° - Perpendicular right (clockwise)
-            MovementDirection.BACKWARD: np.pi,           # 180° - Reverse
-            MovementDirection.BACKWARD_LEFT: 3*np.pi/4,  # +135° - Diagonal back-left
-            MovementDirection.BACKWARD_RIGHT: -3*np.pi/4,# -135° - Diagonal back-right
+            MovementDirection.FORWARD_LEFT: math.pi/4,   # +45° - Diagonal left (counterclockwise)
+            MovementDirection.FORWARD_RIGHT: -math.pi/4, # -45° - Diagonal right (clockwise)
+            MovementDirection.LEFT: math.pi/2,           # +90° - Perpendicular left (counterclockwise)
+            MovementDirection.RIGHT: -math.pi/2,         # -90° - Perpendicular right (clockwise)
+            MovementDirection.BACKWARD: math.pi,         # 180° - Reverse
+            MovementDirection.BACKWARD_LEFT: 3*math.pi/4, # +135° - Diagonal back-left
+            MovementDirection.BACKWARD_RIGHT: -3*math.pi/4,# -135° - Diagonal back-right
             MovementDirection.STOP: 0.0,                 # Special case: zero velocity
         }
 
@@ -68,14 +108,76 @@ class PhysicsEngine:
             RotationCommand.HARD_RIGHT: -config.rotation.hard_turn_degrees_per_second,
         }
 
+        # Rotation rates converted once to radians per second. All lookup
+        # tables hold plain Python floats: NumPy scalars would leak into ship
+        # and torpedo headings and slow every scalar operation on them
+        self.ROTATION_RATES_RAD = {
+            rotation: math.radians(rate) for rotation, rate in self.ROTATION_RATES.items()
+        }
+
+        # AE cost rates (AE per second, from config)
+        # Built once so per-substep lookups don't rebuild the table
+        self.MOVEMENT_AE_RATES = {
+            MovementDirection.FORWARD: config.movement.forward_ae_per_second,
+            MovementDirection.FORWARD_LEFT: config.movement.diagonal_ae_per_second,
+            MovementDirection.FORWARD_RIGHT: config.movement.diagonal_ae_per_second,
+            MovementDirection.LEFT: config.movement.perpendicular_ae_per_second,
+            MovementDirection.RIGHT: config.movement.perpendicular_ae_per_second,
+            MovementDirection.BACKWARD: config.movement.backward_ae_per_second,
+            MovementDirection.BACKWARD_LEFT: config.movement.backward_diagonal_ae_per_second,
+            MovementDirection.BACKWARD_RIGHT: config.movement.backward_diagonal_ae_per_second,
+            MovementDirection.STOP: config.movement.stop_ae_per_second,
+        }
+        self.ROTATION_AE_RATES = {
+            RotationCommand.NONE: config.rotation.none_ae_per_second,
+            RotationCommand.SOFT_LEFT: config.rotation.soft_turn_ae_per_second,
+            RotationCommand.SOFT_RIGHT: config.rotation.soft_turn_ae_per_second,
+            RotationCommand.HARD_LEFT: config.rotation.hard_turn_ae_per_second,
+            RotationCommand.HARD_RIGHT: config.rotation.hard_turn_ae_per_second,
+        }
+        # Same rates scaled to a whole action phase, for order validation
+        self.MOVEMENT_AE_PER_PHASE = {
+            movement: rate * self.action_phase_duration for movement, rate in self.MOVEMENT_AE_RATES.items()
+        }
+        self.ROTATION_AE_PER_PHASE = {
+            rotation: rate * self.action_phase_duration for rotation, rate in self.ROTATION_AE_RATES.items()
+        }
+
+        # Blast zone lifecycle: phase breakpoints (seconds of age) and
+        # radius rates, fixed by config so computed once instead of per zone
+        torpedo = config.torpedo
+        self.blast_max_radius = torpedo.blast_radius_units
+        self.blast_expansion_end = torpedo.blast_expansion_seconds
+        self.blast_persistence_end = torpedo.blast_expansion_seconds + torpedo.blast_persistence_seconds
+        self.blast_growth_rate = torpedo.blast_radius_units / torpedo.blast_expansion_seconds
+        self.blast_shrink_rate = torpedo.blast_radius_units / torpedo.blast_dissipation_seconds
+
+        # Phaser parameters per configuration: (cosine of the half arc,
+        # squared range, damage, cooldown seconds)
+        phaser = config.phaser
+        self.PHASER_PARAMS = {
+            PhaserConfig.WIDE: (
+                math.cos(math.radians(phaser.wide.arc_degrees) * 0.5),
+                phaser.wide.range_units ** 2,
+                phaser.wide.damage,
+                phaser.wide.cooldown_seconds,
+            ),
+            PhaserConfig.FOCUSED: (
+                math.cos(math.radians(phaser.focused.arc_degrees) * 0.5),
+                phaser.focused.range_units ** 2,
+                phaser.focused.damage,
+                phaser.focused.cooldown_seconds,
+            ),
+        }
+
         # Torpedo rotation angles (simple string-based commands)
         # Torpedoes use simple coupled movement (rotation angle per command)
         self.TORPEDO_ROTATION_ANGLES = {
-            "STRAIGHT": 0,
-            "SOFT_LEFT": np.radians(15),
-            "SOFT_RIGHT": -np.radians(15),
-            "HARD_LEFT": np.radians(45),
-            "HARD_RIGHT": -np.radians(45),
+            "STRAIGHT": 0.0,
+            "SOFT_LEFT": math.radians(15),
+            "SOFT_RIGHT": -math.radians(15),
+            "HARD_LEFT": math.radians(45),
+            "HARD_RIGHT": -math.radians(45),
         }
 
         # AE costs and regeneration (using decision interval)
@@ -111,31 +213,81 @@ class PhysicsEngine:
         )
         events.extend(weapon_events_a + weapon_events_b)
 
-        # 2.5. Apply torpedo orders (set detonation timers)
-        self._apply_torpedo_orders(new_state, valid_orders_a, valid_orders_b)
+        # 2.5. Apply torpedo orders (set detonation timers, resolve steering)
+        torpedo_rotations = self._apply_torpedo_orders(new_state, valid_orders_a, valid_orders_b)
 
         # 3. Simulate action phase with fixed timestep
         # AE costs, regeneration, and cooldown decrement happen per substep in _update_ship_physics()
-        for substep in range(self.substeps):
-            self._update_ship_physics(new_state.ship_a, valid_orders_a, self.fixed_timestep)
-            self._update_ship_physics(new_state.ship_b, valid_orders_b, self.fixed_timestep)
-
+        if not self.use_analytic:
+            # Order-derived constants are fixed for the whole action phase
+            ship_constants_a = self._ship_step_constants(valid_orders_a, self.fixed_timestep)
+            ship_constants_b = self._ship_step_constants(valid_orders_b, self.fixed_timestep)
+            self._refresh_ship_velocity(new_state.ship_a, ship_constants_a[1])
+            self._refresh_ship_velocity(new_state.ship_b, ship_constants_b[1])
+            needs_substeps = True
             for torpedo in new_state.torpedoes:
-                torpedo_action_str = valid_orders_a.torpedo_orders.get(torpedo.id) \
-                    if torpedo.owner == "ship_a" \
-                    else valid_orders_b.torpedo_orders.get(torpedo.id)
-                self._update_torpedo_physics(torpedo, torpedo_action_str, self.fixed_timestep)
+                self._refresh_torpedo_velocity(torpedo)
+        else:
+            # Ship and torpedo motion depend only on their own orders, so
+            # everything is integrated up front; the loop only needs positions
+            torpedo_paths = self._integrate_torpedo_motion(
+                new_state.torpedoes, torpedo_rotations, self.fixed_timestep
+            )
+            # The substep loop only drives blast zones and detonations; a turn
+            # with neither skips it and needs just the ships' final positions
+            needs_substeps = bool(new_state.blast_zones or torpedo_paths.detonations)
+            path_a = self._integrate_ship_motion(
+                new_state.ship_a, valid_orders_a, self.fixed_timestep, path=needs_substeps
+            )
+            path_b = self._integrate_ship_motion(
+                new_state.ship_b, valid_orders_b, self.fixed_timestep, path=needs_substeps
+            )
+
+        for substep in range(self.substeps if needs_substeps else 0):
+            if not self.use_analytic:
+                self._step_ship(new_state.ship_a, ship_constants_a, self.fixed_timestep)
+                self._step_ship(new_state.ship_b, ship_constants_b, self.fixed_timestep)
+
+                for torpedo in new_state.torpedoes:
+                    self._step_torpedo(torpedo, torpedo_rotations[id(torpedo)], self.fixed_timestep)
 
             # Update blast zone lifecycles (expansion/persistence/dissipation)
             # Called BEFORE detonations so newly created zones don't update same substep
-            self._update_blast_zones(new_state.blast_zones, self.fixed_timestep)
+            if new_state.blast_zones:
+                self._update_blast_zones(new_state.blast_zones, self.fixed_timestep)
 
             # Handle torpedo detonations (creates blast zones)
-            self._handle_torpedo_detonations(new_state, events, self.fixed_timestep)
+            if not self.use_analytic:
+                if new_state.torpedoes:
+                    self._handle_torpedo_detonations(new_state, events, self.fixed_timestep)
+            elif substep in torpedo_paths.detonations:
+                detonating = [torpedo_paths.apply(row, substep) for row in torpedo_paths.detonations[substep]]
+                self._detonate_torpedoes(new_state, detonating, events)
 
             # Apply blast damage to ships in zones
-            blast_damage_events = self._apply_blast_damage(new_state, self.fixed_timestep)
-            events.extend(blast_damage_events)
+            if new_state.blast_zones:
+                positions = None
+                if self.use_analytic:
+                    positions = (
+                        (path_a[0][substep], path_a[1][substep]),
+                        (path_b[0][substep], path_b[1][substep]),
+                    )
+                blast_damage_events = self._apply_blast_damage(new_state, self.fixed_timestep, positions)
+                events.extend(blast_damage_events)
+
+        if self.use_analytic:
+            new_state.ship_a.position = Vec2D(path_a[0][-1], path_a[1][-1])
+            new_state.ship_b.position = Vec2D(path_b[0][-1], path_b[1][-1])
+            detonated = {row for rows in torpedo_paths.detonations.values() for row in rows}
+            for row in range(len(torpedo_paths.torpedoes)):
+                if row not in detonated:
+                    torpedo_paths.apply(row, -1)
+        else:
+            # Headings were accumulated unwrapped through the substeps
+            self._wrap_heading(new_state.ship_a)
+            self._wrap_heading(new_state.ship_b)
+            for torpedo in new_state.torpedoes:
+                self._wrap_heading(torpedo)
 
         # 4. Check for hits after full action phase
         phaser_events = self._check_phaser_hits(new_state)
@@ -170,42 +322,33 @@ class PhysicsEngine:
 
         Args:
             movement: Movement direction command
-            config: Game configuration
 
         Returns:
             AE cost in AE per second
         """
-        rates = {
-            MovementDirection.FORWARD: self.config.movement.forward_ae_per_second,
-            MovementDirection.FORWARD_LEFT: self.config.movement.diagonal_ae_per_second,
-            MovementDirection.FORWARD_RIGHT: self.config.movement.diagonal_ae_per_second,
-            MovementDirection.LEFT: self.config.movement.perpendicular_ae_per_second,
-            MovementDirection.RIGHT: self.config.movement.perpendicular_ae_per_second,
-            MovementDirection.BACKWARD: self.config.movement.backward_ae_per_second,
-            MovementDirection.BACKWARD_LEFT: self.config.movement.backward_diagonal_ae_per_second,
-            MovementDirection.BACKWARD_RIGHT: self.config.movement.backward_diagonal_ae_per_second,
-            MovementDirection.STOP: self.config.movement.stop_ae_per_second,
-        }
-        return rates[movement]
+        return self.MOVEMENT_AE_RATES[movement]
 
     def _get_rotation_ae_rate(self, rotation: RotationCommand) -> float:
         """Get AE cost rate for rotation command.
 
         Args:
             rotation: Rotation command
-            config: Game configuration
 
         Returns:
             AE cost in AE per second
         """
-        rates = {
-            RotationCommand.NONE: self.config.rotation.none_ae_per_second,
-            RotationCommand.SOFT_LEFT: self.config.rotation.soft_turn_ae_per_second,
-            RotationCommand.SOFT_RIGHT: self.config.rotation.soft_turn_ae_per_second,
-            RotationCommand.HARD_LEFT: self.config.rotation.hard_turn_ae_per_second,
-            RotationCommand.HARD_RIGHT: self.config.rotation.hard_turn_ae_per_second,
-        }
-        return rates[rotation]
+        return self.ROTATION_AE_RATES[rotation]
+
+    def _total_ae_cost(self, orders: Orders) -> float:
+        """AE cost of sustaining orders' movement and rotation for a whole action phase.
+
+        Args:
+            orders: Orders to cost
+
+        Returns:
+            Combined movement and rotation cost in AE
+        """
+        return self.MOVEMENT_AE_PER_PHASE[orders.movement] + self.ROTATION_AE_PER_PHASE[orders.rotation]
 
     def _validate_orders(self, ship: ShipState, orders: Orders) -> Orders:
         """Validate orders and adjust if insufficient AE.
@@ -213,11 +356,7 @@ class PhysicsEngine:
         Checks combined cost of movement + rotation.
         If insufficient AE, downgrades to STOP + NONE.
         """
-        movement_cost = self._get_movement_ae_rate(orders.movement) * self.action_phase_duration
-        rotation_cost = self._get_rotation_ae_rate(orders.rotation) * self.action_phase_duration
-        total_cost = movement_cost + rotation_cost
-
-        if total_cost > ship.ae:
+        if self._total_ae_cost(orders) > ship.ae:
             # Insufficient AE - downgrade to STOP + NONE
             orders.movement = MovementDirection.STOP
             orders.rotation = RotationCommand.NONE
@@ -229,14 +368,15 @@ class PhysicsEngine:
         if weapon_action == "LAUNCH_TORPEDO":
             launch_cost = self.config.torpedo.launch_cost_ae
             max_torpedoes = self.config.torpedo.max_active_per_ship
-            if ship.ae >= launch_cost and len([t for t in state.torpedoes if t.owner == ship_id]) < max_torpedoes:
+            active = sum(1 for t in state.torpedoes if t.owner == ship_id)
+            if ship.ae >= launch_cost and active < max_torpedoes:
                 ship.ae -= launch_cost
                 new_torpedo = TorpedoState(
                     id=f"{ship_id}_torpedo_{state.turn}",
                     position=ship.position,
                     velocity=Vec2D(
-                        np.cos(ship.heading) * self.torpedo_speed,
-                        np.sin(ship.heading) * self.torpedo_speed
+                        math.cos(ship.heading) * self.torpedo_speed,
+                        math.sin(ship.heading) * self.torpedo_speed
                     ),
                     heading=ship.heading,
                     ae_remaining=self.config.torpedo.max_ae_capacity,
@@ -258,21 +398,28 @@ class PhysicsEngine:
 
         return events
 
-    def _apply_torpedo_orders(self, state: GameState, orders_a: Orders, orders_b: Orders):
+    def _apply_torpedo_orders(self, state: GameState, orders_a: Orders, orders_b: Orders) -> Dict[int, float]:
         """Apply torpedo orders at start of turn.
 
         Sets detonation timers for torpedoes with detonate_after commands.
-        Movement commands will be applied during substeps.
+        Each order string is parsed once here; movement commands are returned
+        as per-substep rotations for the action phase.
 
         Args:
             state: Current game state
             orders_a: Orders for ship A
             orders_b: Orders for ship B
+
+        Returns:
+            Rotation in radians per fixed substep for every torpedo, keyed by
+            id(torpedo) since torpedo ids are not guaranteed unique
         """
+        rotations = {}
         for torpedo in state.torpedoes:
             # Get orders for this torpedo from the owning ship
             orders = orders_a if torpedo.owner == "ship_a" else orders_b
             action_str = orders.torpedo_orders.get(torpedo.id)
+            action_type = None
 
             if action_str:
                 try:
@@ -280,28 +427,194 @@ class PhysicsEngine:
                     if action_type == "detonate_after":
                         # Set detonation timer
                         torpedo.detonation_timer = delay
-                    # Movement commands will be handled in _update_torpedo_physics
                 except ValueError as e:
                     logger.warning(f"Invalid torpedo action '{action_str}' for {torpedo.id}: {e}")
 
-    def _apply_ae_regeneration(self, ship: ShipState, dt: float):
-        """Apply AE regeneration for one substep.
+            rotations[id(torpedo)] = self._torpedo_rotation_for_action(
+                torpedo, action_type, self.fixed_timestep
+            )
+        return rotations
+
+    def _integrate_ship_motion(
+        self, ship: ShipState, orders: Orders, dt: float, path: bool = True
+    ) -> Tuple[List[float], List[float]]:
+        """Advance a ship through a whole action phase in closed form.
+
+        Equivalent to calling _update_ship_physics once per substep: the
+        heading after substep k is heading + k * rotation, and the velocity
+        angles form an arithmetic sequence, so the displacement is a
+        Dirichlet-kernel sum evaluated with a handful of scalar trig calls.
+        AE and phaser cooldown change by a constant amount per substep between
+        clamps, so their end-of-phase values are computed directly.
+
+        The final state always comes from _integrate_ship_endpoint, so it does
+        not depend on whether intermediate positions were requested; those are
+        a running sum of the per-substep velocities and only feed blast zone
+        checks.
+
+        Sets the ship's final heading, velocity, AE and cooldown. The position
+        is left for the caller, which may need intermediate positions.
+
+        Args:
+            ship: Ship to advance
+            orders: Validated orders for the ship
+            dt: Substep length in seconds
+            path: Whether to return the position after every substep
+
+        Returns:
+            Tuple of (xs, ys): ship position after each substep, or only the
+            final position when path is False
+        """
+        x0, y0, heading0 = ship.position.x, ship.position.y, ship.heading
+        x, y = self._integrate_ship_endpoint(ship, orders, dt)
+        self._advance_ship_resources(ship, orders, dt)
+
+        if not path:
+            return [x], [y]
+        if orders.movement == MovementDirection.STOP:
+            return [x0] * self.substeps, [y0] * self.substeps
+
+        # Positions after substeps 1..n-1; the last one is the endpoint above
+        steps = np.arange(1, self.substeps)
+        velocity_angles = (
+            heading0 + self.ROTATION_RATES_RAD[orders.rotation] * dt * steps
+            + self.MOVEMENT_DIRECTION_OFFSETS[orders.movement]
+        )
+        xs = (x0 + np.cumsum(np.cos(velocity_angles) * self.ship_speed * dt)).tolist()
+        ys = (y0 + np.cumsum(np.sin(velocity_angles) * self.ship_speed * dt)).tolist()
+        xs.append(x)
+        ys.append(y)
+        return xs, ys
+
+    def _integrate_ship_endpoint(
+        self, ship: ShipState, orders: Orders, dt: float
+    ) -> Tuple[float, float]:
+        """Final heading, velocity and position of a ship after an action phase.
+
+        Args:
+            ship: Ship to advance (heading and velocity are updated)
+            orders: Validated orders for the ship
+            dt: Substep length in seconds
+
+        Returns:
+            Tuple of (x, y): the final position
+        """
+        n = self.substeps
+        rotation = self.ROTATION_RATES_RAD[orders.rotation] * dt
+        heading0 = ship.heading
+        ship.heading = (heading0 + rotation * n) % TWO_PI
+
+        if orders.movement == MovementDirection.STOP:
+            ship.velocity = Vec2D(0, 0)
+            return ship.position.x, ship.position.y
+
+        offset = self.MOVEMENT_DIRECTION_OFFSETS[orders.movement]
+        velocity_angle = ship.heading + offset
+        ship.velocity = Vec2D(
+            math.cos(velocity_angle) * self.ship_speed,
+            math.sin(velocity_angle) * self.ship_speed
+        )
+
+        # sum_{k=1..n} e^{i(a + k*w)} = e^{i(a + (n+1)w/2)} * sin(n*w/2) / sin(w/2)
+        if rotation == 0:
+            scale, mid_angle = n, heading0 + offset
+        else:
+            scale = math.sin(n * rotation * 0.5) / math.sin(rotation * 0.5)
+            mid_angle = heading0 + offset + (n + 1) * rotation * 0.5
+        distance = self.ship_speed * dt * scale
+        return (
+            ship.position.x + math.cos(mid_angle) * distance,
+            ship.position.y + math.sin(mid_angle) * distance,
+        )
+
+    def _advance_ship_resources(self, ship: ShipState, orders: Orders, dt: float):
+        """Apply a whole action phase of AE change and cooldown in closed form.
+
+        Args:
+            ship: Ship to update
+            orders: Validated orders for the ship
+            dt: Substep length in seconds
+        """
+        n = self.substeps
+
+        # AE: constant net change per substep, clamped to [0, max_ae] each time.
+        # After the first clamp the sequence is monotonic, so one more suffices.
+        max_ae = self.ship_max_ae
+        ae_delta = (
+            self.ae_regen_per_second
+            - self._get_movement_ae_rate(orders.movement)
+            - self._get_rotation_ae_rate(orders.rotation)
+        ) * dt
+        ae = max(0.0, min(ship.ae + ae_delta, max_ae))
+        ship.ae = max(0.0, min(ae + (n - 1) * ae_delta, max_ae))
+
+        # Phaser cooldown
+        if ship.phaser_cooldown_remaining > 0.0:
+            ship.phaser_cooldown_remaining = max(0.0, ship.phaser_cooldown_remaining - n * dt)
 
-        Regenerates AE continuously per substep, capping at maximum AE.
-        Part of Story 021: Continuous AE tracking system.
+    def _ship_step_constants(self, orders: Orders, dt: float) -> Tuple[float, Optional[float], float]:
+        """Per-substep constants for a ship's orders, computed once per turn.
 
         Args:
-            ship: Ship to regenerate AE for
-            dt: Time delta in seconds for this substep
+            orders: Validated orders for the ship
+            dt: Substep length in seconds
+
+        Returns:
+            Tuple of (rotation per substep in radians, movement offset in
+            radians or None for STOP, net AE change per substep: regeneration
+            minus movement and rotation costs)
         """
-        regen_amount = self.config.ship.ae_regen_per_second * dt
-        ship.ae += regen_amount
-        # Cap AE at maximum
-        ship.ae = min(ship.ae, self.config.ship.max_ae)
+        movement_offset = None
+        if orders.movement != MovementDirection.STOP:
+            movement_offset = self.MOVEMENT_DIRECTION_OFFSETS[orders.movement]
+        return (
+            self.ROTATION_RATES_RAD[orders.rotation] * dt,
+            movement_offset,
+            (
+                self.ae_regen_per_second
+                - self._get_movement_ae_rate(orders.movement)
+                - self._get_rotation_ae_rate(orders.rotation)
+            ) * dt,
+        )
 
     def _update_ship_physics(self, ship: ShipState, orders: Orders, dt: float):
         """Update ship position and heading for one timestep.
 
+        Convenience wrapper around _step_ship for a single substep.
+        """
+        constants = self._ship_step_constants(orders, dt)
+        self._refresh_ship_velocity(ship, constants[1])
+        self._step_ship(ship, constants, dt)
+        self._wrap_heading(ship)
+
+    @staticmethod
+    def _wrap_heading(entity):
+        """Wrap a ship's or torpedo's heading to [0, 2π)."""
+        if not 0.0 <= entity.heading < TWO_PI:
+            entity.heading %= TWO_PI
+
+    def _refresh_ship_velocity(self, ship: ShipState, movement_offset: Optional[float]):
+        """Set a ship's velocity from its heading and movement offset.
+
+        Args:
+            ship: Ship to update
+            movement_offset: Movement offset in radians, or None for STOP
+        """
+        if movement_offset is None:
+            ship.velocity = Vec2D(0, 0)
+        else:
+            # Velocity direction is heading + movement offset
+            velocity_angle = ship.heading + movement_offset
+            ship.velocity = Vec2D(
+                math.cos(velocity_angle) * self.ship_speed,
+                math.sin(velocity_angle) * self.ship_speed
+            )
+
+    def _step_ship(
+        self, ship: ShipState, constants: Tuple[float, Optional[float], float], dt: float
+    ):
+        """Advance a ship by one substep using precomputed order constants.
+
         Independent movement and rotation system (Stories 005-006):
         1. Apply rotation (changes heading)
         2. Apply movement (sets velocity direction relative to heading)
@@ -310,51 +623,155 @@ class PhysicsEngine:
         5. Apply rotation AE cost per substep (Story 023)
         6. Regenerate AE (Story 021)
         7. Decrement phaser cooldown (Story 021)
-        """
-        # 1. Apply rotation (independent of movement)
-        rotation_rate_deg_per_sec = self.ROTATION_RATES[orders.rotation]
-        rotation_per_dt_rad = np.radians(rotation_rate_deg_per_sec * dt)
-        ship.heading += rotation_per_dt_rad
-        ship.heading = ship.heading % (2 * np.pi)  # Wrap to [0, 2π)
-
-        # 2. Apply movement (independent of rotation)
-        if orders.movement == MovementDirection.STOP:
-            ship.velocity = Vec2D(0, 0)
-        else:
-            # Calculate velocity direction (heading + movement offset)
-            movement_offset = self.MOVEMENT_DIRECTION_OFFSETS[orders.movement]
-            velocity_angle = ship.heading + movement_offset
 
-            # Set velocity based on movement direction
-            ship.velocity = Vec2D(
-                np.cos(velocity_angle) * self.ship_speed,
-                np.sin(velocity_angle) * self.ship_speed
-            )
-
-        # 3. Update position
-        ship.position = ship.position + (ship.velocity * dt)
+        The velocity is only recomputed when the ship turns; otherwise the
+        stored velocity is reused, so it must match the heading and orders on
+        entry (see _refresh_ship_velocity).
 
-        # 4. Apply movement AE cost per substep (Story 022)
-        movement_ae_rate = self._get_movement_ae_rate(orders.movement)
-        ae_cost_movement = movement_ae_rate * dt
-        ship.ae -= ae_cost_movement
+        Args:
+            ship: Ship to update
+            constants: Result of _ship_step_constants for the ship's orders
+            dt: Time delta for this substep
+        """
+        rotation_per_dt_rad, movement_offset, ae_delta = constants
 
-        # 5. Apply rotation AE cost per substep (Story 023)
-        rotation_ae_rate = self._get_rotation_ae_rate(orders.rotation)
-        ae_cost_rotation = rotation_ae_rate * dt
-        ship.ae -= ae_cost_rotation
+        # 1. Apply rotation (independent of movement). The heading is left
+        # unwrapped between substeps; callers wrap it once (_wrap_heading)
+        if rotation_per_dt_rad != 0:
+            ship.heading += rotation_per_dt_rad
 
-        # 6. Regenerate AE per substep (Story 021)
-        self._apply_ae_regeneration(ship, dt)
+            # 2. Velocity only changes direction when the heading does
+            self._refresh_ship_velocity(ship, movement_offset)
 
-        # 7. Clamp AE at zero (no negative values)
-        ship.ae = max(0.0, ship.ae)
+        # 3. Update position
+        if movement_offset is not None:
+            velocity = ship.velocity
+            ship.position = Vec2D(ship.position.x + velocity.x * dt, ship.position.y + velocity.y * dt)
+
+        # 4-7. Movement and rotation AE costs (Stories 022-023) and
+        # regeneration (Story 021) as one net change, capped at maximum AE
+        # and clamped at zero
+        max_ae = self.ship_max_ae
+        ae = ship.ae + ae_delta
+        if ae > max_ae:
+            ae = max_ae
+        ship.ae = ae if ae > 0.0 else 0.0
 
         # 8. Decrement phaser cooldown per substep (Story 021)
         if ship.phaser_cooldown_remaining > 0.0:
             ship.phaser_cooldown_remaining -= dt
             ship.phaser_cooldown_remaining = max(0.0, ship.phaser_cooldown_remaining)
 
+    def _torpedo_rotation_per_step(self, torpedo: TorpedoState, action_str: Optional[str], dt: float) -> float:
+        """Heading change per substep requested by a torpedo's movement order.
+
+        Args:
+            torpedo: Torpedo being steered
+            action_str: Action string (e.g., "HARD_LEFT" or "detonate_after:8.5" or None)
+            dt: Time delta for one substep
+
+        Returns:
+            Rotation in radians per substep (0 for no order, detonation
+            commands, invalid commands and torpedoes launched this turn)
+        """
+        if not action_str or torpedo.just_launched:
+            return 0
+        try:
+            action_type, _ = parse_torpedo_action(action_str)
+        except ValueError:
+            # Invalid action format, ignore
+            return 0
+        return self._torpedo_rotation_for_action(torpedo, action_type, dt)
+
+    def _torpedo_rotation_for_action(
+        self, torpedo: TorpedoState, action_type: Optional[str], dt: float
+    ) -> float:
+        """Heading change per substep for an already-parsed torpedo action.
+
+        Args:
+            torpedo: Torpedo being steered
+            action_type: Parsed action type, or None for no (or invalid) order
+            dt: Time delta for one substep
+
+        Returns:
+            Rotation in radians per substep, as for _torpedo_rotation_per_step
+        """
+        if action_type is None or action_type == "detonate_after" or torpedo.just_launched:
+            return 0
+        rotation_angle = self.TORPEDO_ROTATION_ANGLES.get(action_type.upper())
+        if rotation_angle is None:
+            logger.warning(f"Invalid torpedo movement '{action_type}', defaulting to STRAIGHT")
+            return 0
+        return rotation_angle * dt / self.action_phase_duration
+
+    def _integrate_torpedo_motion(
+        self, torpedoes: List[TorpedoState], rotations: Dict[int, float], dt: float
+    ) -> _TorpedoPaths:
+        """Integrate every torpedo in flight through a whole action phase.
+
+        Torpedo motion, AE burn and detonation timers depend only on the
+        torpedo and its orders, so all torpedoes are advanced together as
+        (torpedo, substep) arrays. AE and timers are accumulated with the same
+        sequential subtraction _update_torpedo_physics and
+        _handle_torpedo_detonations perform, so detonation substeps match the
+        per-substep path exactly.
+
+        Args:
+            torpedoes: Torpedoes in flight at the start of the action phase
+            rotations: Rotation per substep keyed by id(torpedo), as returned
+                by _apply_torpedo_orders
+            dt: Substep length in seconds
+
+        Returns:
+            _TorpedoPaths with per-substep state and detonation schedule
+        """
+        n = self.substeps
+        count = len(torpedoes)
+        if not count:
+            empty = np.empty((0, n))
+            return _TorpedoPaths([], empty, empty, empty, empty, empty, empty, empty, {})
+        steps = np.arange(1, n + 1)
+
+        rotation = np.array(
+            [rotations[id(torpedo)] for torpedo in torpedoes], dtype=float
+        ).reshape(count, 1)
+        heading0 = np.array([t.heading for t in torpedoes], dtype=float).reshape(count, 1)
+
+        # Heading only changes for torpedoes that are turning; if none are,
+        # velocities are evaluated once per torpedo
+        if rotation.any():
+            headings = heading0 + rotation * steps
+        else:
+            headings = heading0
+
+        vx = np.broadcast_to(np.cos(headings) * self.torpedo_speed, (count, n))
+        vy = np.broadcast_to(np.sin(headings) * self.torpedo_speed, (count, n))
+        headings = np.broadcast_to(headings, (count, n))
+
+        def accumulate(ufunc, start: List[float], per_step) -> np.ndarray:
+            # Prepend the start value so accumulation order matches position += step
+            columns = np.empty((count, n + 1))
+            columns[:, 0] = start
+            columns[:, 1:] = per_step
+            return ufunc.accumulate(columns, axis=1)[:, 1:]
+
+        x = accumulate(np.add, [t.position.x for t in torpedoes], vx * dt)
+        y = accumulate(np.add, [t.position.y for t in torpedoes], vy * dt)
+        ae = accumulate(np.subtract, [t.ae_remaining for t in torpedoes],
+                        self.torpedo_burn_per_second * dt)
+        timed = np.array([t.detonation_timer is not None for t in torpedoes], dtype=bool)
+        timer = accumulate(np.subtract, [
+            np.nan if t.detonation_timer is None else t.detonation_timer for t in torpedoes
+        ], dt)
+
+        # Timed torpedoes detonate on their timer only; others when AE runs out
+        detonate = np.where(timed.reshape(count, 1), timer <= 0.0, ae <= 0)
+        detonations: Dict[int, List[int]] = {}
+        for row in np.flatnonzero(detonate.any(axis=1)).tolist():
+            detonations.setdefault(int(detonate[row].argmax()), []).append(row)
+
+        return _TorpedoPaths(list(torpedoes), x, y, vx, vy, headings, ae, timer, detonations)
+
     def _update_torpedo_physics(self, torpedo: TorpedoState, action_str: Optional[str], dt: float):
         """Update torpedo physics for one timestep.
 
@@ -363,39 +780,41 @@ class PhysicsEngine:
             action_str: Action string (e.g., "HARD_LEFT" or "detonate_after:8.5" or None)
             dt: Time delta for this substep
         """
-        # Parse action to determine if it's a movement command
-        rotation_angle = 0
-        if action_str and not torpedo.just_launched:
-            try:
-                action_type, _ = parse_torpedo_action(action_str)
-                # Only process movement commands (ignore detonate_after)
-                if action_type != "detonate_after":
-                    # Parse as simple string command
-                    action_upper = action_type.upper()
-                    if action_upper in self.TORPEDO_ROTATION_ANGLES:
-                        rotation_angle = self.TORPEDO_ROTATION_ANGLES[action_upper]
-                    else:
-                        logger.warning(f"Invalid torpedo movement '{action_type}', defaulting to STRAIGHT")
-                        rotation_angle = 0
-            except ValueError:
-                # Invalid action format, ignore
-                pass
-
-        # Apply movement (rotation)
-        if not torpedo.just_launched and rotation_angle != 0:
-            rotation_per_dt = rotation_angle * dt / self.action_phase_duration
-            torpedo.heading += rotation_per_dt
-            torpedo.heading = torpedo.heading % (2 * np.pi)
+        self._refresh_torpedo_velocity(torpedo)
+        self._step_torpedo(torpedo, self._torpedo_rotation_per_step(torpedo, action_str, dt), dt)
+        self._wrap_heading(torpedo)
 
-        # Update velocity and position
+    def _refresh_torpedo_velocity(self, torpedo: TorpedoState):
+        """Set a torpedo's velocity from its heading at full speed."""
         torpedo.velocity = Vec2D(
-            np.cos(torpedo.heading) * self.torpedo_speed,
-            np.sin(torpedo.heading) * self.torpedo_speed
+            math.cos(torpedo.heading) * self.torpedo_speed,
+            math.sin(torpedo.heading) * self.torpedo_speed
         )
-        torpedo.position = torpedo.position + (torpedo.velocity * dt)
+
+    def _step_torpedo(self, torpedo: TorpedoState, rotation_per_dt: float, dt: float):
+        """Advance a torpedo by one substep.
+
+        The velocity is only recomputed when the torpedo turns; otherwise the
+        stored velocity is reused, so it must match the heading on entry (see
+        _refresh_torpedo_velocity).
+
+        Args:
+            torpedo: Torpedo to update
+            rotation_per_dt: Result of _torpedo_rotation_per_step for its orders
+            dt: Time delta for this substep
+        """
+        # Apply movement (rotation); detonation commands don't steer. The
+        # heading is left unwrapped between substeps (see _wrap_heading)
+        if rotation_per_dt != 0:
+            torpedo.heading += rotation_per_dt
+            self._refresh_torpedo_velocity(torpedo)
+
+        # Update position
+        velocity = torpedo.velocity
+        torpedo.position = Vec2D(torpedo.position.x + velocity.x * dt, torpedo.position.y + velocity.y * dt)
 
         # AE burn
-        torpedo.ae_remaining -= self.config.torpedo.ae_burn_straight_per_second * dt
+        torpedo.ae_remaining -= self.torpedo_burn_per_second * dt
 
     def _update_blast_zones(self, blast_zones: List[BlastZone], dt: float):
         """Update all blast zones per substep (lifecycle progression).
@@ -406,54 +825,47 @@ class PhysicsEngine:
             blast_zones: List of active blast zones to update
             dt: Time step in seconds
         """
-        zones_to_remove = []
+        # Survivors are collected in one pass; fully dissipated zones are
+        # simply not carried over
+        surviving = []
+        max_radius = self.blast_max_radius
+        growth_step = self.blast_growth_rate * dt  # e.g., 15.0 / 5.0 = 3.0 units/s
+        shrink_step = self.blast_shrink_rate * dt
 
         for zone in blast_zones:
             # Increment age
             zone.age += dt
 
             if zone.phase == BlastZonePhase.EXPANSION:
-                # Calculate expansion rate from config
-                expansion_duration = self.config.torpedo.blast_expansion_seconds
-                max_radius = self.config.torpedo.blast_radius_units
-                growth_rate = max_radius / expansion_duration  # e.g., 15.0 / 5.0 = 3.0 units/s
-
                 # Grow radius
-                zone.current_radius += growth_rate * dt
+                zone.current_radius += growth_step
                 zone.current_radius = min(zone.current_radius, max_radius)  # Cap at max
 
                 # Check for phase transition
-                if zone.age >= expansion_duration:
+                if zone.age >= self.blast_expansion_end:
                     zone.phase = BlastZonePhase.PERSISTENCE
                     zone.current_radius = max_radius  # Ensure exact max radius
 
             elif zone.phase == BlastZonePhase.PERSISTENCE:
                 # Maintain current radius (no changes to radius)
-                # Calculate when persistence ends
-                persistence_start = self.config.torpedo.blast_expansion_seconds
-                persistence_end = persistence_start + self.config.torpedo.blast_persistence_seconds
-
                 # Check for phase transition to dissipation
-                if zone.age >= persistence_end:
+                if zone.age >= self.blast_persistence_end:
                     zone.phase = BlastZonePhase.DISSIPATION
 
             elif zone.phase == BlastZonePhase.DISSIPATION:
                 # Shrink radius: 15.0 → 0.0 over dissipation_duration seconds
-                dissipation_duration = self.config.torpedo.blast_dissipation_seconds
-                max_radius = self.config.torpedo.blast_radius_units
-                shrink_rate = max_radius / dissipation_duration  # e.g., 15.0 / 5.0 = 3.0 units/s
-
-                # Shrink radius
-                zone.current_radius -= shrink_rate * dt
+                zone.current_radius -= shrink_step
                 zone.current_radius = max(0.0, zone.current_radius)  # Clamp at 0
 
-                # Mark for removal when fully dissipated
+                # Drop when fully dissipated
                 if zone.current_radius <= 0.0:
-                    zones_to_remove.append(zone)
+                    continue
 
-        # Remove dissipated zones
-        for zone in zones_to_remove:
-            blast_zones.remove(zone)
+            surviving.append(zone)
+
+        # Callers hold a reference to the list, so it is updated in place
+        if len(surviving) != len(blast_zones):
+            blast_zones[:] = surviving
 
     def _handle_torpedo_detonations(self, state: GameState, events: List[Event], dt: float):
         """Check for detonations and create blast zones.
@@ -478,8 +890,18 @@ class PhysicsEngine:
             elif torpedo.ae_remaining <= 0:
                 torpedoes_to_detonate.append(torpedo)
 
+        self._detonate_torpedoes(state, torpedoes_to_detonate, events)
+
+    def _detonate_torpedoes(self, state: GameState, torpedoes: List[TorpedoState], events: List[Event]):
+        """Replace detonating torpedoes with blast zones.
+
+        Args:
+            state: Current game state
+            torpedoes: Torpedoes detonating this substep, in state order
+            events: Event list to append detonation events to
+        """
         # Create blast zones for detonating torpedoes
-        for torpedo in torpedoes_to_detonate:
+        for torpedo in torpedoes:
             blast_zone = BlastZone(
                 id=f"{torpedo.id}_blast",
                 position=Vec2D(torpedo.position.x, torpedo.position.y),
@@ -508,7 +930,12 @@ class PhysicsEngine:
             # Remove torpedo from state
             state.torpedoes.remove(torpedo)
 
-    def _apply_blast_damage(self, state: GameState, dt: float) -> List[Event]:
+    def _apply_blast_damage(
+        self,
+        state: GameState,
+        dt: float,
+        positions: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None
+    ) -> List[Event]:
         """Apply continuous damage to ships in blast zones.
 
         Damage rate = (base_damage ÷ 15.0) per second
@@ -517,11 +944,22 @@ class PhysicsEngine:
         Args:
             state: Current game state
             dt: Time step (typically 0.1 seconds)
+            positions: Ship (x, y) coordinates for this substep as
+                ((ship_a_x, ship_a_y), (ship_b_x, ship_b_y)); defaults to the
+                ships' stored positions. Lets the analytic path pass its
+                precomputed path without building Vec2D objects per substep.
 
         Returns:
             List of blast damage events
         """
         events = []
+        if positions is None:
+            positions = (
+                (state.ship_a.position.x, state.ship_a.position.y),
+                (state.ship_b.position.x, state.ship_b.position.y),
+            )
+        (ax, ay), (bx, by) = positions
+        ships = (("ship_a", state.ship_a, ax, ay), ("ship_b", state.ship_b, bx, by))
 
         for zone in state.blast_zones:
             # Calculate damage for this zone
@@ -529,11 +967,18 @@ class PhysicsEngine:
             damage_this_substep = damage_per_second * dt
 
             # Check each ship for collision with zone
-            for ship_id, ship in [("ship_a", state.ship_a), ("ship_b", state.ship_b)]:
-                distance = ship.position.distance_to(zone.position)
+            radius_sq = zone.current_radius * zone.current_radius
+            zx = zone.position.x
+            zy = zone.position.y
 
-                if distance < zone.current_radius:
+            for ship_id, ship, x, y in ships:
+                dx = x - zx
+                dy = y - zy
+                distance_sq = dx * dx + dy * dy
+
+                if distance_sq < radius_sq:
                     # Ship is inside blast zone - apply damage
+                    distance = math.sqrt(distance_sq)
                     ship.shields -= damage_this_substep
 
                     # Record damage event (for replay/debugging)
@@ -553,66 +998,82 @@ class PhysicsEngine:
         return events
 
     def _check_phaser_hits(self, state: GameState) -> List[Event]:
-        """Check if either ship's phaser hit opponent."""
+        """Check if either ship's phaser hit opponent.
+
+        Both checks share one separation vector: ship B sees ship A along the
+        same offset negated, at the same distance.
+        """
         events = []
-        
-        if not state.ship_a.reconfiguring_phaser:
+        ship_a, ship_b = state.ship_a, state.ship_b
+        dx = ship_b.position.x - ship_a.position.x
+        dy = ship_b.position.y - ship_a.position.y
+        distance_sq = dx * dx + dy * dy
+
+        if not ship_a.reconfiguring_phaser:
             hit = self._check_single_phaser_hit(
-                state.ship_a, state.ship_b, "ship_a", "ship_b", state.turn
+                ship_a, ship_b, "ship_a", "ship_b", state.turn, dx, dy, distance_sq
             )
             if hit:
                 events.append(hit)
-        
-        if not state.ship_b.reconfiguring_phaser:
+
+        if not ship_b.reconfiguring_phaser:
             hit = self._check_single_phaser_hit(
-                state.ship_b, state.ship_a, "ship_b", "ship_a", state.turn
+                ship_b, ship_a, "ship_b", "ship_a", state.turn, -dx, -dy, distance_sq
             )
             if hit:
                 events.append(hit)
-        
+
         return events
-    
+
     def _check_single_phaser_hit(
         self,
         attacker: ShipState,
         target: ShipState,
         attacker_id: str,
         target_id: str,
-        turn: int
+        turn: int,
+        dx: float,
+        dy: float,
+        distance_sq: float
     ) -> Optional[Event]:
-        """Check if attacker's phaser hits target."""
+        """Check if attacker's phaser hits target.
+
+        The target is inside the arc when the angle between the attacker's
+        heading and the offset to the target is at most half the arc, i.e.
+        when the offset's projection onto the heading is at least
+        cos(arc / 2) times its length. No atan2 or angle wrapping needed.
+
+        Args:
+            attacker: Firing ship
+            target: Ship being fired at
+            attacker_id: ID of the firing ship
+            target_id: ID of the target ship
+            turn: Current turn number
+            dx: Target x minus attacker x
+            dy: Target y minus attacker y
+            distance_sq: dx * dx + dy * dy
+        """
         # Story 024: Check cooldown before firing
         if attacker.phaser_cooldown_remaining > 0.0:
             return None  # Cannot fire - still on cooldown
 
-        distance = attacker.position.distance_to(target.position)
-
-        # Determine phaser parameters from config
-        if attacker.phaser_config == PhaserConfig.WIDE:
-            arc = np.radians(self.config.phaser.wide.arc_degrees)
-            max_range = self.config.phaser.wide.range_units
-            damage = self.config.phaser.wide.damage
-            cooldown = self.config.phaser.wide.cooldown_seconds
-        else:  # FOCUSED
-            arc = np.radians(self.config.phaser.focused.arc_degrees)
-            max_range = self.config.phaser.focused.range_units
-            damage = self.config.phaser.focused.damage
-            cooldown = self.config.phaser.focused.cooldown_seconds
-
-        # Check range
-        if distance > max_range:
+        arc_cos, range_sq, damage, cooldown = self.PHASER_PARAMS[attacker.phaser_config]
+
+        # Check range on squared distance before any trig
+        if distance_sq > range_sq:
             return None
 
         # Check if target is in firing arc
-        delta = target.position - attacker.position
-        angle_to_target = np.arctan2(delta.y, delta.x)
-
-        angle_diff = (angle_to_target - attacker.heading) % (2 * np.pi)
-        if angle_diff > np.pi:
-            angle_diff -= 2 * np.pi
-
-        # Check if within arc
-        if abs(angle_diff) <= arc / 2:
+        distance = math.sqrt(distance_sq)
+        if distance_sq == 0.0:
+            # Overlapping ships: the bearing to the target is taken as 0
+            # (atan2(0, 0)), so they only hit when heading within half the
+            # arc of +X
+            in_arc = math.cos(attacker.heading) >= arc_cos
+        else:
+            projection = dx * math.cos(attacker.heading) + dy * math.sin(attacker.heading)
+            in_arc = projection >= arc_cos * distance
+        if in_arc:
             target.shields -= damage
 
             # Story 024: Set cooldown after successful fire
@@ -634,29 +1095,32 @@ class PhysicsEngine:
 
     def _check_torpedo_collisions(self, state: GameState) -> List[Event]:
         events = []
-        torpedoes_to_remove = []
+        # Survivors are collected in one pass; exhausted and detonating
+        # torpedoes are simply not carried over
+        surviving = []
+        # Each torpedo can only hit the enemy of its owner
+        targets = {"ship_a": ("ship_b", state.ship_b), "ship_b": ("ship_a", state.ship_a)}
+        blast_radius_sq = self.config.torpedo.blast_radius_units ** 2
         for torpedo in state.torpedoes:
             if torpedo.ae_remaining <= 0:
-                torpedoes_to_remove.append(torpedo)
                 continue
 
-            for ship_id, ship in [("ship_a", state.ship_a), ("ship_b", state.ship_b)]:
-                if torpedo.owner != ship_id:
-                    distance = torpedo.position.distance_to(ship.position)
-                    if distance < self.config.torpedo.blast_radius_units:
-                        damage = int(torpedo.ae_remaining * self.config.torpedo.blast_damage_multiplier)
-                        ship.shields -= damage
-                        events.append(Event(
-                            type="torpedo_hit",
-                            turn=state.turn,
-                            data={
-                                "torpedo_id": torpedo.id,
-                                "target": ship_id,
-                                "damage": damage
-                            }
-                        ))
-                        torpedoes_to_remove.append(torpedo)
-                        break # Torpedo hits one ship and is removed
-        
-        state.torpedoes = [t for t in state.torpedoes if t not in torpedoes_to_remove]
+            target_id, target = targets[torpedo.owner]
+            if torpedo.position.distance_sq_to(target.position) < blast_radius_sq:
+                damage = int(torpedo.ae_remaining * self.config.torpedo.blast_damage_multiplier)
+                target.shields -= damage
+                events.append(Event(
+                    type="torpedo_hit",
+                    turn=state.turn,
+                    data={
+                        "torpedo_id": torpedo.id,
+                        "target": target_id,
+                        "damage": damage
+                    }
+                ))
+                continue  # Torpedo hits its target and is removed
+
+            surviving.append(torpedo)
+
+        state.torpedoes = surviving
         return events
@@ -0,0 +1,66 @@
+"""
+JSON encoding helpers for AI Arena.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both paths produce the same document structure; orjson is
+substantially faster on large replay files.
+"""
+import dataclasses
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is optional; stdlib json is a drop-in fallback
+    _orjson = None
+    import json as _stdlib_json
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active.
+if _orjson is not None:
+    JSONDecodeError = _orjson.JSONDecodeError
+else:
+    JSONDecodeError = _stdlib_json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode types neither backend handles natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize (dicts, lists, dataclasses, enums, NumPy values)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, default=_default, option=option)
+
+    return _stdlib_json.dumps(
+        obj, default=_default, indent=2 if indent else None
+    ).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON document from bytes or str.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _stdlib_json.loads(data)
@@ -1,8 +1,6 @@
 import litellm
 from typing import Tuple, Optional
-import json
 import asyncio
-import numpy as np
 import os
 import logging
 from pathlib import Path
@@ -12,12 +10,15 @@ logger = logging.getLogger(__name__)
 
 from ai_arena.game_engine.data_models import (
     GameState, Orders, MovementDirection, RotationCommand,
-    ShipState, Vec2D, PhaserConfig
+    ShipState, Vec2D, PhaserConfig, parse_movement, parse_rotation,
+    MOVEMENT_VALUES, ROTATION_VALUES
 )
 from ai_arena.config import GameConfig
+from ai_arena.io import json as _json
 from ai_arena.llm_adapter.prompt_formatter import (
     build_user_prompt,
-    format_system_prompt_with_config
+    format_system_prompt_with_config,
+    partition_torpedoes
 )
 
 load_dotenv()
@@ -27,6 +28,25 @@ litellm.api_key = os.getenv("OPENAI_API_KEY")
 litellm.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 litellm.groq_api_key = os.getenv("GROQ_API_KEY")
 
+# JSON Schema for the orders response, sent to providers that enforce
+# structured output. Not strict: torpedo_orders is keyed by torpedo id,
+# which strict mode cannot express. Weapon actions stay free-form strings
+# since unknown ones are already ignored by the physics engine.
+ORDERS_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "thinking": {"type": "string"},
+        "ship_movement": {"type": "string", "enum": sorted(MOVEMENT_VALUES)},
+        "ship_rotation": {"type": "string", "enum": sorted(ROTATION_VALUES)},
+        "weapon_action": {"type": "string"},
+        "torpedo_orders": {
+            "type": "object",
+            "additionalProperties": {"type": "string"}
+        }
+    },
+    "required": ["thinking", "ship_movement", "ship_rotation", "weapon_action"]
+}
+
 
 class LLMAdapter:
     """
@@ -51,6 +71,16 @@ class LLMAdapter:
         self.model_b = model_b
         self.config = config
         self._load_system_prompt()
+
+        # The config is fixed for the adapter's lifetime, so the system
+        # prompt is formatted once instead of on every turn for every ship
+        self._system_prompt = format_system_prompt_with_config(
+            LLMAdapter._system_prompt_cache,
+            config
+        )
+        self._response_formats = {
+            model: self._response_format_for(model) for model in (model_a, model_b)
+        }
     
     async def get_orders_for_both_ships(
         self, 
@@ -60,9 +90,11 @@ class LLMAdapter:
         Get orders from both models in parallel.
         Returns: (orders_a, thinking_a, orders_b, thinking_b)
         """
+        # Both prompts list the same torpedoes, so split them by owner once
+        torpedoes = partition_torpedoes(state)
         results = await asyncio.gather(
-            self._get_orders_for_ship(state, "ship_a", self.model_a),
-            self._get_orders_for_ship(state, "ship_b", self.model_b),
+            self._get_orders_for_ship(state, "ship_a", self.model_a, torpedoes),
+            self._get_orders_for_ship(state, "ship_b", self.model_b, torpedoes),
             return_exceptions=True  # Don't let one failure kill both
         )
         
@@ -86,10 +118,11 @@ class LLMAdapter:
         self, 
         state: GameState, 
         ship_id: str, 
-        model: str
+        model: str,
+        torpedoes: Optional[Tuple[list, list]] = None
     ) -> Tuple[Orders, str]:
         """Get orders from a single model."""
-        prompt = self._build_prompt(state, ship_id)
+        prompt = self._build_prompt(state, ship_id, torpedoes)
         
         try:
             response = await litellm.acompletion(
@@ -98,7 +131,7 @@ class LLMAdapter:
                 max_tokens=1000,
                 temperature=0.7,
                 timeout=30.0,
-                response_format={ "type": "json_object" }
+                response_format=self._response_formats[model]
             )
             
             response_text = response.choices[0].message.content
@@ -113,6 +146,33 @@ class LLMAdapter:
             print(f"LLM error for {ship_id}: {e}")
             return self._default_orders(), f"ERROR: {str(e)}"
     
+    @staticmethod
+    def _response_format_for(model: str) -> dict:
+        """Pick the response_format to request from a model.
+
+        Models that support structured output get ORDERS_RESPONSE_SCHEMA, so
+        the provider enforces the orders shape; others fall back to plain
+        JSON mode.
+
+        Args:
+            model: Model identifier, e.g. "gpt-4o"
+
+        Returns:
+            response_format argument for litellm.acompletion
+        """
+        try:
+            supports_schema = litellm.supports_response_schema(model=model)
+        except Exception:
+            # Unknown provider or model: plain JSON mode is always accepted
+            supports_schema = False
+
+        if not supports_schema:
+            return {"type": "json_object"}
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": "orders", "schema": ORDERS_RESPONSE_SCHEMA}
+        }
+
     def _load_system_prompt(self):
         """Load system prompt from file and cache it (class-level cache)."""
         if LLMAdapter._system_prompt_cache is None:
@@ -131,27 +191,28 @@ class LLMAdapter:
 
             logger.info(f"Loaded system prompt from {prompt_file}")
 
-    def _build_prompt(self, state: GameState, ship_id: str) -> list:
+    def _build_prompt(
+        self,
+        state: GameState,
+        ship_id: str,
+        torpedoes: Optional[Tuple[list, list]] = None
+    ) -> list:
         """Build prompt with game state and rules.
 
         Args:
             state: Current game state
             ship_id: "ship_a" or "ship_b"
+            torpedoes: Torpedoes split by owner (see partition_torpedoes)
 
         Returns:
             List of message dicts for LLM API
         """
-        # Get cached system prompt and format with config values
-        system_prompt = format_system_prompt_with_config(
-            LLMAdapter._system_prompt_cache,
-            self.config
-        )
-
         # Build user prompt from game state
-        user_prompt = build_user_prompt(state, ship_id)
+        user_prompt = build_user_prompt(state, ship_id, torpedoes)
 
+        # Fresh message dicts each call: providers may annotate them in place
         return [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": self._system_prompt},
             {"role": "user", "content": user_prompt}
         ]
     
@@ -172,22 +233,22 @@ class LLMAdapter:
             Tuple of (Orders object, thinking string)
         """
         try:
-            parsed = json.loads(response_text)
+            parsed = _json.loads(response_text)
             thinking = parsed.get("thinking", "No reasoning provided.")
 
             # Parse movement direction (NEW)
             movement_str = parsed.get("ship_movement", "STOP").upper()
             try:
-                movement = MovementDirection[movement_str]
-            except KeyError:
+                movement = parse_movement(movement_str)
+            except ValueError:
                 logger.warning(f"{ship_id} invalid movement '{movement_str}', defaulting to STOP")
                 movement = MovementDirection.STOP
 
             # Parse rotation command (NEW)
             rotation_str = parsed.get("ship_rotation", "NONE").upper()
             try:
-                rotation = RotationCommand[rotation_str]
-            except KeyError:
+                rotation = parse_rotation(rotation_str)
+            except ValueError:
                 logger.warning(f"{ship_id} invalid rotation '{rotation_str}', defaulting to NONE")
                 rotation = RotationCommand.NONE
 
@@ -209,7 +270,7 @@ class LLMAdapter:
                 torpedo_orders=torpedo_orders
             ), thinking
 
-        except json.JSONDecodeError as e:
+        except _json.JSONDecodeError as e:
             logger.error(f"{ship_id} JSON parse error: {e}")
             logger.error(f"Response: {response_text[:200]}")
             return self._default_orders(), "JSON PARSE ERROR"
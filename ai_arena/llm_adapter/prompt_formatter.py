@@ -3,8 +3,8 @@ Shared prompt formatting utilities for LLM adapter.
 
 This module provides functions to format game state into prompts for LLMs.
 """
-import numpy as np
-from typing import List
+import math
+from typing import List, Optional, Tuple
 from ai_arena.game_engine.data_models import GameState, ShipState, TorpedoState, BlastZone
 from ai_arena.config import GameConfig
 
@@ -20,7 +20,7 @@ def format_ship_status(ship: ShipState, ship_id: str) -> str:
         Formatted ship status string
     """
     return f"""- Position: ({ship.position.x:.1f}, {ship.position.y:.1f})
-- Heading: {np.degrees(ship.heading):.1f}°
+- Heading: {math.degrees(ship.heading):.1f}°
 - Shields: {ship.shields}/100
 - AE: {ship.ae}/100
 - Phaser: {ship.phaser_config.value}
@@ -54,10 +54,10 @@ def format_torpedo_list(torpedoes: List[TorpedoState], count: int, max_count: in
     Returns:
         Formatted torpedo list string
     """
-    result = ""
-    for t in torpedoes:
-        result += f"\n- {t.id}: pos ({t.position.x:.1f}, {t.position.y:.1f}), AE {t.ae_remaining}"
-    return result
+    return "".join(
+        f"\n- {t.id}: pos ({t.position.x:.1f}, {t.position.y:.1f}), AE {t.ae_remaining}"
+        for t in torpedoes
+    )
 
 
 def format_blast_zones(
@@ -78,37 +78,62 @@ def format_blast_zones(
     if not blast_zones:
         return "\n\nBLAST ZONES: None active"
 
-    result = f"\n\nBLAST ZONES ({len(blast_zones)} active):"
+    # Fragments are collected and joined once rather than concatenated
+    parts = [f"\n\nBLAST ZONES ({len(blast_zones)} active):"]
     for zone in blast_zones:
         owner_marker = "YOUR" if zone.owner == ship_id else "ENEMY"
-        result += f"\n- {zone.id} ({owner_marker}):"
-        result += f"\n  Position: ({zone.position.x:.1f}, {zone.position.y:.1f})"
-        result += f"\n  Phase: {zone.phase.value}, Age: {zone.age:.1f}s"
-        result += f"\n  Radius: {zone.current_radius:.1f} units"
         damage_rate = zone.base_damage / 15.0
-        result += f"\n  Damage rate: {damage_rate:.2f}/second"
         distance = our_position.distance_to(zone.position)
-        result += f"\n  Distance from you: {distance:.1f} units"
+        parts.append(
+            f"\n- {zone.id} ({owner_marker}):"
+            f"\n  Position: ({zone.position.x:.1f}, {zone.position.y:.1f})"
+            f"\n  Phase: {zone.phase.value}, Age: {zone.age:.1f}s"
+            f"\n  Radius: {zone.current_radius:.1f} units"
+            f"\n  Damage rate: {damage_rate:.2f}/second"
+            f"\n  Distance from you: {distance:.1f} units"
+        )
         if distance < zone.current_radius:
-            result += f"\n  ⚠️  YOU ARE INSIDE THIS BLAST ZONE! Taking {damage_rate:.2f} damage/second!"
+            parts.append(f"\n  ⚠️  YOU ARE INSIDE THIS BLAST ZONE! Taking {damage_rate:.2f} damage/second!")
+
+    return "".join(parts)
+
 
-    return result
+def partition_torpedoes(state: GameState) -> Tuple[List[TorpedoState], List[TorpedoState]]:
+    """Split torpedoes by owner in a single pass.
 
+    Args:
+        state: Current game state
 
-def build_user_prompt(state: GameState, ship_id: str) -> str:
+    Returns:
+        Tuple of (ship_a's torpedoes, ship_b's torpedoes)
+    """
+    by_a = []
+    by_b = []
+    for t in state.torpedoes:
+        (by_a if t.owner == "ship_a" else by_b).append(t)
+    return by_a, by_b
+
+
+def build_user_prompt(
+    state: GameState,
+    ship_id: str,
+    torpedoes: Optional[Tuple[List[TorpedoState], List[TorpedoState]]] = None
+) -> str:
     """Build user prompt from game state.
 
     Args:
         state: Current game state
         ship_id: "ship_a" or "ship_b"
+        torpedoes: Result of partition_torpedoes(state), so both ships'
+            prompts can share one pass; computed here if omitted
 
     Returns:
         Formatted user prompt string
     """
     us = state.ship_a if ship_id == "ship_a" else state.ship_b
     enemy = state.ship_b if ship_id == "ship_a" else state.ship_a
-    our_torpedoes = [t for t in state.torpedoes if t.owner == ship_id]
-    enemy_torpedoes = [t for t in state.torpedoes if t.owner != ship_id]
+    by_a, by_b = torpedoes if torpedoes is not None else partition_torpedoes(state)
+    our_torpedoes, enemy_torpedoes = (by_a, by_b) if ship_id == "ship_a" else (by_b, by_a)
 
     prompt = f"""TURN {state.turn}
 
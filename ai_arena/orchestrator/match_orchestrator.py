@@ -3,15 +3,15 @@ from ai_arena.game_engine.data_models import GameState, Orders, MatchConfig, Mat
 from ai_arena.llm_adapter.adapter import LLMAdapter
 from ai_arena.game_engine.physics import PhysicsEngine
 from ai_arena.replay.recorder import ReplayRecorder
-from ai_arena.config import ConfigLoader
+from ai_arena.config import get_config
 
 class MatchOrchestrator:
     def __init__(self, model_a: str, model_b: str):
         self.model_a = model_a
         self.model_b = model_b
 
-        # Load game configuration
-        self.config = ConfigLoader().load("config.json")
+        # Shared per-process game configuration
+        self.config = get_config("config.json")
 
         # Initialize components with config
         self.llm_adapter = LLMAdapter(model_a, model_b, self.config)
@@ -23,32 +23,36 @@ class MatchOrchestrator:
         print(f"Starting match between {self.model_a} and {self.model_b}")
         
         state = self._initialize_match()
-        
-        for turn in range(1, max_turns + 1):
-            print(f"Turn {turn}")
-            
-            orders_a, thinking_a, orders_b, thinking_b = await self.llm_adapter.get_orders_for_both_ships(state)
-            
-            # Store state before physics resolution for replay
-            state_for_replay = self.physics_engine.copy_state(state)
-
-            new_state, events = self.physics_engine.resolve_turn(state, orders_a, orders_b)
-            
-            self.replay_recorder.record_turn(turn, state_for_replay, orders_a, orders_b, thinking_a, thinking_b, events)
-            
-            state = new_state
-            
-            winner = self._check_win_condition(state)
-            if winner:
-                print(f"Match over! Winner: {winner}")
-                final_data = self.replay_recorder.finalize(winner, turn)
-                final_data['status'] = 'completed'
-                return final_data
-
-        print("Match ended due to max turns reached.")
-        final_data = self.replay_recorder.finalize("tie", max_turns)
-        final_data['status'] = 'completed'
-        return final_data
+
+        try:
+            for turn in range(1, max_turns + 1):
+                print(f"Turn {turn}")
+
+                orders_a, thinking_a, orders_b, thinking_b = await self.llm_adapter.get_orders_for_both_ships(state)
+
+                # Store state before physics resolution for replay
+                state_for_replay = self.physics_engine.copy_state(state)
+
+                new_state, events = self.physics_engine.resolve_turn(state, orders_a, orders_b)
+
+                self.replay_recorder.record_turn(turn, state_for_replay, orders_a, orders_b, thinking_a, thinking_b, events)
+
+                state = new_state
+
+                winner = self._check_win_condition(state)
+                if winner:
+                    print(f"Match over! Winner: {winner}")
+                    final_data = self.replay_recorder.finalize(winner, turn)
+                    final_data['status'] = 'completed'
+                    return final_data
+
+            print("Match ended due to max turns reached.")
+            final_data = self.replay_recorder.finalize("tie", max_turns)
+            final_data['status'] = 'completed'
+            return final_data
+        finally:
+            # No-op once finalized; otherwise drops the partial replay file
+            self.replay_recorder.abort()
 
     def _initialize_match(self) -> GameState:
         """Initializes the game state using config values."""
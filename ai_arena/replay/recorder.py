@@ -1,21 +1,38 @@
-import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List
-import copy
+from typing import List, Union
 from enum import Enum
 
+from ai_arena.io.json import dumps, loads
 from ai_arena.game_engine.data_models import GameState, Orders, Event, ShipState, TorpedoState, BlastZone, Vec2D, PhaserConfig
 
 class ReplayRecorder:
-    """Records match data for deterministic replay."""
+    """Records match data for deterministic replay.
+
+    Turns are streamed to disk as they are recorded, one compact JSON
+    object per line inside the replay's "turns" array. The file is
+    written as ``<match_id>.json.part`` and renamed into place by
+    finalize(), so the finished replay is an ordinary JSON document and
+    in-progress matches never show up as broken replays. A match that
+    ends without finalize() must call abort() to close and remove the
+    partial file. Recorded turns are not kept in memory; read them back
+    from the finished replay file.
+    """
     
-    def __init__(self, model_a: str, model_b: str):
+    def __init__(self, model_a: str, model_b: str, replay_dir: Union[str, Path] = "replays"):
+        """
+        Args:
+            model_a: Model identifier for ship A
+            model_b: Model identifier for ship B
+            replay_dir: Directory the replay file is written to
+        """
         self.model_a = model_a
         self.model_b = model_b
-        self.turns = []
+        self.turn_count = 0
         self.match_id = self._generate_match_id()
+        self.replay_path = Path(replay_dir) / f"{self.match_id}.json"
+        self._replay_file = None
     
     def record_turn(
         self,
@@ -37,32 +54,85 @@ class ReplayRecorder:
             "thinking_b": thinking_b,
             "events": [self._serialize_event(e) for e in events]
         }
-        self.turns.append(turn_data)
+        # Write the turn now rather than serializing the whole match at the end
+        separator = b"\n" if self.turn_count == 0 else b",\n"
+        self._open_replay_file().write(separator + dumps(turn_data))
+        self.turn_count += 1
     
     def finalize(self, winner: str, total_turns: int) -> dict:
-        """Finalize match and save to file."""
-        match_data = {
+        """Finalize match and save to file.
+
+        Returns:
+            Match summary with the replay file path; the turns themselves
+            are only in the file
+        """
+        summary = {
+            "winner": winner,
+            "total_turns": total_turns,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
+        # Close the turns array, then the summary fields close the object
+        replay_file = self._open_replay_file()
+        replay_file.write(b"\n]" + self._json_members(summary) + b"}\n")
+        replay_file.close()
+        self._replay_file = None
+        self._part_path().replace(self.replay_path)
+
+        print(f"Replay saved: {self.replay_path}")
+        return {
             "match_id": self.match_id,
             "models": {
                 "ship_a": self.model_a,
                 "ship_b": self.model_b
             },
-            "winner": winner,
-            "total_turns": total_turns,
-            "created_at": datetime.utcnow().isoformat(),
-            "turns": self.turns
+            **summary,
+            "replay_path": str(self.replay_path)
         }
-        
-        # Save to file
-        replay_path = Path("replays") / f"{self.match_id}.json"
-        replay_path.parent.mkdir(exist_ok=True)
-        
-        with open(replay_path, 'w') as f:
-            json.dump(match_data, f, indent=2)
-        
-        print(f"Replay saved: {replay_path}")
-        return match_data
+
+    def abort(self):
+        """Discard an unfinished replay: close the file and remove the .part file.
+
+        Does nothing if no turn was recorded or the replay was already
+        finalized, so it is safe to call from a finally block.
+        """
+        if self._replay_file is None:
+            return
+        self._replay_file.close()
+        self._replay_file = None
+        self._part_path().unlink(missing_ok=True)
+
+    def _part_path(self) -> Path:
+        return self.replay_path.with_name(self.replay_path.name + ".part")
+
+    def _open_replay_file(self):
+        """Open the in-progress replay file, writing its header on first use."""
+        if self._replay_file is None:
+            self.replay_path.parent.mkdir(parents=True, exist_ok=True)
+            self._replay_file = open(self._part_path(), "wb")
+            models = {
+                "ship_a": self.model_a,
+                "ship_b": self.model_b
+            }
+            # Leave the object open: turns and summary fields follow
+            self._replay_file.write(
+                b'{"match_id":' + dumps(self.match_id)
+                + b',"models":' + dumps(models)
+                + b',"turns":['
+            )
+        return self._replay_file
     
+    @staticmethod
+    def _json_members(fields: dict) -> bytes:
+        """Encode dict items as JSON object members, each preceded by a comma.
+
+        Appends the summary fields after the streamed turns array without
+        slicing braces off a serialized dict.
+        """
+        return b"".join(
+            b"," + dumps(key) + b":" + dumps(value) for key, value in fields.items()
+        )
+
     def _generate_match_id(self) -> str:
         """Generate unique match ID."""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -128,10 +198,13 @@ class ReplayRecorder:
         }
     
     def _serialize_event(self, event: Event) -> dict:
-        # A simple way to serialize dataclasses that might contain other non-serializable types
-        e = copy.deepcopy(event)
-        e.data = self._serialize_dict(e.data)
-        return e.__dict__
+        # Events are frozen and slotted, so build the dict explicitly and
+        # serialize a copy of the payload rather than mutating the event
+        return {
+            "type": event.type,
+            "turn": event.turn,
+            "data": self._serialize_dict(dict(event.data))
+        }
 
     def _serialize_dict(self, data: dict) -> dict:
         for key, value in data.items():
@@ -151,17 +224,15 @@ class ReplayLoader:
         # First, try direct filename match (for new replays)
         replay_path = replay_dir / f"{match_id}.json"
         if replay_path.exists():
-            with open(replay_path, 'r') as f:
-                return json.load(f)
+            return loads(replay_path.read_bytes())
 
         # If not found, search for file containing this match_id (for old replays)
         if replay_dir.exists():
             for replay_file in replay_dir.glob("*.json"):
                 try:
-                    with open(replay_file, 'r') as f:
-                        data = json.load(f)
-                        if data.get("match_id") == match_id:
-                            return data
+                    data = loads(replay_file.read_bytes())
+                    if data.get("match_id") == match_id:
+                        return data
                 except Exception:
                     pass
 
@@ -177,8 +248,7 @@ class ReplayLoader:
         matches = []
         for replay_file in sorted(replay_dir.glob("*.json"), key=os.path.getmtime, reverse=True):
             try:
-                with open(replay_file, 'r') as f:
-                    data = json.load(f)
+                data = loads(replay_file.read_bytes())
 
                 # Handle both old and new replay formats
                 if "models" in data:
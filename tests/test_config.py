@@ -4,10 +4,13 @@ Tests for configuration loading system.
 
 import pytest
 import json
+import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
-from ai_arena.config import ConfigLoader, GameConfig
+from ai_arena.config import ConfigLoader, GameConfig, get_config, load_config
 from ai_arena.config.loader import (
     ConfigError,
     SimulationConfig,
@@ -416,3 +419,242 @@ class TestConfigValidation:
         # Should not raise any errors
         config = loader.load("config.json")
         assert config is not None
+
+    def test_sections_validate_on_construction(self):
+        """An out-of-range section cannot be constructed directly."""
+        with pytest.raises(ConfigError) as exc_info:
+            ArenaConfig(width_units=100.0, height_units=-1.0, spawn_distance_units=200.0)
+
+        error_msg = str(exc_info.value)
+        assert "ArenaConfig.height_units must be > 0" in error_msg
+        assert "ArenaConfig.spawn_distance_units must be <= width_units" in error_msg
+
+    def test_errors_report_nested_paths(self):
+        """Errors from shared section types name the path they came from."""
+        with open("config.json") as f:
+            data = json.load(f)
+        data["phaser"]["focused"]["arc_degrees"] = 0.0
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader()._parse_config(data)
+
+        assert "phaser.focused.arc_degrees" in str(exc_info.value)
+        assert "phaser.wide" not in str(exc_info.value)
+
+    def test_validate_reports_nested_paths(self):
+        """Re-validating an existing config names each violation by dotted path."""
+        with open("config.json") as f:
+            config = ConfigLoader()._parse_config(json.load(f))
+        # Bypass the frozen dataclass to simulate a config changed after parsing
+        object.__setattr__(config.phaser.focused, "arc_degrees", 0.0)
+        object.__setattr__(config.arena, "height_units", -1.0)
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader()._validate(config)
+
+        error_msg = str(exc_info.value)
+        assert "phaser.focused.arc_degrees must be > 0 and <= 360" in error_msg
+        assert "arena.height_units must be > 0" in error_msg
+        assert "phaser.wide" not in error_msg
+
+
+class TestConfigCaching:
+    """Test that repeated loads reuse the parsed config."""
+
+    def test_repeated_load_returns_cached_instance(self):
+        """Loading an unchanged file twice returns the same object."""
+        loader = ConfigLoader()
+        first = loader.load("config.json")
+        second = ConfigLoader().load("./config.json")
+
+        assert first is second
+
+    def test_modified_file_is_reloaded(self):
+        """Changing the file's mtime invalidates the cached entry."""
+        with open("config.json") as f:
+            data = json.load(f)
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        loader = ConfigLoader()
+
+        try:
+            first = loader.load(temp_path)
+
+            data["ship"]["starting_shields"] = 80.0
+            with open(temp_path, 'w') as f:
+                json.dump(data, f)
+            stat = os.stat(temp_path)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            second = loader.load(temp_path)
+
+            assert second is not first
+            assert second.ship.starting_shields == 80.0
+        finally:
+            Path(temp_path).unlink()
+
+    def test_load_config_matches_loader_shim(self):
+        """ConfigLoader.load is the module-level load_config."""
+        assert ConfigLoader().load("config.json") is load_config("config.json")
+
+    def test_get_config_returns_shared_instance(self):
+        """get_config hands every caller the same GameConfig."""
+        assert get_config() is get_config()
+        assert isinstance(get_config(), GameConfig)
+
+    def test_get_config_shares_instance_across_path_spellings(self):
+        """Relative, ./-prefixed and absolute paths give the same GameConfig."""
+        config = get_config("config.json")
+
+        assert get_config("./config.json") is config
+        assert get_config(str(Path("config.json").resolve())) is config
+
+    def test_get_config_resolves_relative_path_per_directory(self, tmp_path, monkeypatch):
+        """A relative path names the file in the current working directory."""
+        with open("config.json") as f:
+            data = json.load(f)
+        data["ship"]["starting_shields"] = 80.0
+        (tmp_path / "config.json").write_text(json.dumps(data))
+        default = get_config("config.json")
+
+        monkeypatch.chdir(tmp_path)
+
+        assert get_config("config.json") is not default
+        assert get_config("config.json").ship.starting_shields == 80.0
+
+    def test_config_is_immutable(self):
+        """Shared configs cannot be modified in place."""
+        import dataclasses
+
+        config = get_config()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.ship.starting_shields = 1.0
+
+
+class TestConfigParser:
+    """Test the dataclass-driven config parser."""
+
+    def test_parser_builds_nested_sections(self):
+        """Nested dataclass fields are parsed into their own config types."""
+        from ai_arena.config.loader import PhaserModeConfig
+
+        with open("config.json") as f:
+            data = json.load(f)
+
+        config = ConfigLoader()._parse_config(data)
+
+        assert isinstance(config.phaser.wide, PhaserModeConfig)
+        assert config.phaser.focused.range_units == data["phaser"]["focused"]["range_units"]
+
+    def test_parser_checks_each_section_once(self, monkeypatch):
+        """Parsing runs each section's rules once, in its __post_init__."""
+        from ai_arena.config import loader
+
+        checked = []
+        section_errors = loader._section_errors
+
+        def counting_section_errors(cls, section):
+            checked.append(cls.__name__)
+            return section_errors(cls, section)
+
+        monkeypatch.setattr(loader, "_section_errors", counting_section_errors)
+        with open("config.json") as f:
+            ConfigLoader()._parse_config(json.load(f))
+
+        assert sorted(checked) == sorted([
+            "SimulationConfig", "ShipConfig", "MovementConfig", "RotationConfig",
+            "PhaserModeConfig", "PhaserModeConfig", "TorpedoConfig", "ArenaConfig",
+        ])
+
+    def test_parser_reports_missing_nested_field(self):
+        """A missing nested field is reported by name."""
+        with open("config.json") as f:
+            data = json.load(f)
+        del data["phaser"]["wide"]["cooldown_seconds"]
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader()._parse_config(data)
+
+        assert "cooldown_seconds" in str(exc_info.value)
+
+    def test_parser_rejects_unknown_field(self):
+        """A misspelled key is an error rather than silently ignored."""
+        with open("config.json") as f:
+            data = json.load(f)
+        data["ship"]["bogus_key"] = 1.0
+        data["phaser"]["wide"]["arc_degree"] = 90.0
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader()._parse_config(data)
+
+        assert "unknown field(s) in ship: bogus_key" in str(exc_info.value)
+
+        del data["ship"]["bogus_key"]
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader()._parse_config(data)
+
+        assert "unknown field(s) in phaser.wide: arc_degree" in str(exc_info.value)
+
+    def test_load_rejects_unknown_field(self, tmp_path):
+        """load_config reports unknown keys in the file."""
+        with open("config.json") as f:
+            data = json.load(f)
+        data["ship"]["bogus_key"] = 1.0
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(data))
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(str(path))
+
+        assert "bogus_key" in str(exc_info.value)
+
+
+class TestConfigSchema:
+    """Test the JSON Schema check that runs before parsing."""
+
+    def test_schema_matches_dataclasses(self):
+        """schema.json requires exactly the fields the dataclasses declare."""
+        import dataclasses
+        from ai_arena.config.loader import SCHEMA_PATH, GameConfig
+
+        def required(cls, schema):
+            fields = dataclasses.fields(cls)
+            assert schema["required"] == [f.name for f in fields]
+            for f in fields:
+                if dataclasses.is_dataclass(f.type):
+                    required(f.type, schema["properties"][f.name])
+
+        with open(SCHEMA_PATH) as f:
+            required(GameConfig, json.load(f))
+
+    def test_wrong_value_type_rejected(self):
+        """A non-numeric value is reported with its dotted path."""
+        pytest.importorskip("fastjsonschema")
+
+        with open("config.json") as f:
+            data = json.load(f)
+        data["torpedo"]["max_active_per_ship"] = "four"
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader()._check_schema(data)
+
+        assert "torpedo.max_active_per_ship" in str(exc_info.value)
+
+
+class TestConfigImports:
+    """Config validation must not drag in the game engine or numpy."""
+
+    def test_config_package_imports_stay_light(self):
+        code = (
+            "import sys, ai_arena.config; "
+            "heavy = [m for m in ('numpy', 'ai_arena.game_engine', 'fastjsonschema') "
+            "if m in sys.modules]; "
+            "print(' '.join(heavy))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
@@ -5,13 +5,22 @@ and verifies that Orders dataclass works correctly with the new fields.
 """
 
 import pytest
+import dataclasses
+import subprocess
+import sys
+
 from ai_arena.game_engine.data_models import (
     MovementDirection,
     RotationCommand,
     Orders,
     ShipState,
     Vec2D,
-    PhaserConfig
+    PhaserConfig,
+    Event,
+    MOVEMENT_VALUES,
+    parse_movement,
+    parse_rotation,
+    parse_phaser_config,
 )
 
 
@@ -71,6 +80,30 @@ class TestRotationCommandEnum:
         assert len(RotationCommand) == 5
 
 
+class TestEnumParsing:
+    """Test string -> enum parse helpers."""
+
+    def test_parse_movement_returns_member(self):
+        for direction in MovementDirection:
+            assert parse_movement(direction.value) is direction
+
+    def test_parse_rotation_returns_member(self):
+        for rotation in RotationCommand:
+            assert parse_rotation(rotation.value) is rotation
+
+    def test_parse_phaser_config_returns_member(self):
+        assert parse_phaser_config("FOCUSED") is PhaserConfig.FOCUSED
+
+    def test_parse_invalid_value_raises(self):
+        with pytest.raises(ValueError):
+            parse_movement("SIDEWAYS")
+        with pytest.raises(ValueError):
+            parse_rotation("spin")
+
+    def test_movement_values_set(self):
+        assert MOVEMENT_VALUES == {d.value for d in MovementDirection}
+
+
 class TestOrdersDataclass:
     """Test Orders dataclass with new movement and rotation fields."""
 
@@ -238,3 +271,77 @@ class TestShipStateCooldown:
         ship_dict = asdict(ship)
         assert 'phaser_cooldown_remaining' in ship_dict
         assert ship_dict['phaser_cooldown_remaining'] == 2.5
+
+
+class TestVec2D:
+    """Test Vec2D arithmetic and memory layout."""
+
+    def test_vec2d_is_slotted(self):
+        """Verify Vec2D uses __slots__ instead of a per-instance __dict__."""
+        v = Vec2D(1.0, 2.0)
+        assert not hasattr(v, '__dict__')
+        # Frozen + slots raises TypeError for unknown names on Python 3.11
+        with pytest.raises((AttributeError, TypeError)):
+            v.z = 3.0
+
+    def test_vec2d_is_frozen(self):
+        """Verify Vec2D cannot be mutated, so instances can be shared."""
+        v = Vec2D(1.0, 2.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            v.x = 3.0
+
+    def test_vec2d_arithmetic(self):
+        """Verify Vec2D operators still return new vectors."""
+        a = Vec2D(1.0, 2.0)
+        b = Vec2D(3.0, 5.0)
+        assert a + b == Vec2D(4.0, 7.0)
+        assert b - a == Vec2D(2.0, 3.0)
+        assert a * 2 == Vec2D(2.0, 4.0)
+
+    def test_vec2d_magnitude(self):
+        """Verify magnitude returns a native float."""
+        mag = Vec2D(3.0, 4.0).magnitude()
+        assert mag == 5.0
+        assert type(mag) is float
+
+    def test_vec2d_distances(self):
+        """Verify distance_to and distance_sq_to agree."""
+        a = Vec2D(1.0, 1.0)
+        b = Vec2D(4.0, 5.0)
+        assert a.distance_to(b) == 5.0
+        assert a.distance_sq_to(b) == 25.0
+        assert b.distance_sq_to(a) == 25.0
+
+
+class TestSlottedModels:
+    """Test that hot-path dataclasses are slotted and events are immutable."""
+
+    def test_ship_state_is_slotted(self):
+        """Verify ShipState has no per-instance __dict__."""
+        ship = ShipState(
+            position=Vec2D(0, 0),
+            velocity=Vec2D(0, 0),
+            heading=0.0,
+            shields=100,
+            ae=100,
+            phaser_config=PhaserConfig.WIDE
+        )
+        assert not hasattr(ship, '__dict__')
+
+    def test_event_is_frozen(self):
+        """Verify Event cannot be mutated after construction."""
+        event = Event(type="phaser_hit", turn=1, data={"damage": 15.0})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.turn = 2
+
+
+class TestImportCost:
+    """data_models is imported everywhere, so it must stay lightweight."""
+
+    def test_data_models_does_not_import_numpy(self):
+        code = (
+            "import sys, ai_arena.game_engine.data_models; "
+            "sys.exit('numpy' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0
@@ -0,0 +1,54 @@
+"""
+Tests for the shared JSON encoding helpers.
+"""
+import json
+
+import numpy as np
+import pytest
+
+from ai_arena.io.json import dumps, loads, JSONDecodeError
+from ai_arena.game_engine.data_models import Vec2D, PhaserConfig, Event
+
+
+class TestDumps:
+    """Test JSON serialization."""
+
+    def test_returns_bytes(self):
+        """dumps returns UTF-8 encoded bytes."""
+        assert dumps({"a": 1}) == b'{"a":1}'
+
+    def test_indent_matches_stdlib_layout(self):
+        """Indented output decodes to the same document as stdlib json."""
+        data = {"turns": [{"turn": 1, "events": []}], "winner": "ship_a"}
+        assert json.loads(dumps(data, indent=True)) == data
+        assert b"\n  " in dumps(data, indent=True)
+
+    def test_serializes_enums_by_value(self):
+        """Enums are written as their value."""
+        assert loads(dumps({"config": PhaserConfig.FOCUSED})) == {"config": "FOCUSED"}
+
+    def test_serializes_dataclasses(self):
+        """Dataclasses (including slotted ones) are written as objects."""
+        event = Event(type="phaser_hit", turn=3, data={"damage": 15.0})
+        assert loads(dumps(event)) == {"type": "phaser_hit", "turn": 3, "data": {"damage": 15.0}}
+        assert loads(dumps(Vec2D(1.5, 2.0))) == {"x": 1.5, "y": 2.0}
+
+    def test_serializes_numpy_values(self):
+        """NumPy arrays and scalars are written as plain JSON numbers."""
+        data = {"pos": np.array([1.0, 2.0]), "heading": np.float64(0.5)}
+        assert loads(dumps(data)) == {"pos": [1.0, 2.0], "heading": 0.5}
+
+
+class TestLoads:
+    """Test JSON deserialization."""
+
+    def test_accepts_bytes_and_str(self):
+        """loads accepts both bytes and str input."""
+        assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_invalid_json_raises_stdlib_compatible_error(self):
+        """Decode errors can be caught as json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{ invalid }")
+        assert issubclass(JSONDecodeError, json.JSONDecodeError)
@@ -3,11 +3,12 @@ Tests for LLM adapter prompt engineering and order parsing.
 
 Tests Stories 008 (Prompt Engineering) and 009 (Order Parsing).
 """
+import litellm
 import pytest
-from ai_arena.llm_adapter.adapter import LLMAdapter
+from ai_arena.llm_adapter.adapter import LLMAdapter, ORDERS_RESPONSE_SCHEMA
 from ai_arena.game_engine.data_models import (
     MovementDirection, RotationCommand, GameState, ShipState,
-    Vec2D, PhaserConfig
+    Vec2D, PhaserConfig, BlastZone, BlastZonePhase, TorpedoState
 )
 from ai_arena.config import ConfigLoader
 
@@ -86,6 +87,112 @@ def test_system_prompt_includes_json_format(adapter, mock_game_state):
     assert "weapon_action" in system_prompt
 
 
+def test_system_prompt_formatted_once_per_adapter(config, mock_game_state, monkeypatch):
+    """Verify the config-dependent system prompt is not re-formatted every turn."""
+    import ai_arena.llm_adapter.adapter as adapter_module
+    calls = []
+    original = adapter_module.format_system_prompt_with_config
+    monkeypatch.setattr(
+        adapter_module, "format_system_prompt_with_config",
+        lambda prompt, cfg: calls.append(cfg) or original(prompt, cfg)
+    )
+
+    adapter = LLMAdapter("gpt-4", "gpt-4", config)
+    prompt_a = adapter._build_prompt(mock_game_state, "ship_a")
+    prompt_b = adapter._build_prompt(mock_game_state, "ship_b")
+
+    assert len(calls) == 1
+    assert prompt_a[0]["content"] == prompt_b[0]["content"]
+    assert prompt_a[0] is not prompt_b[0]
+
+
+def test_user_prompt_lists_blast_zones(adapter, mock_game_state):
+    """Verify each blast zone is listed, with a warning when the ship is inside it."""
+    us = mock_game_state.ship_a.position
+    mock_game_state.blast_zones = [
+        BlastZone(id="ship_b_torp_1_blast", position=Vec2D(us.x, us.y), base_damage=30.0,
+                  phase=BlastZonePhase.PERSISTENCE, age=10.0, current_radius=15.0, owner="ship_b"),
+        BlastZone(id="ship_a_torp_1_blast", position=Vec2D(us.x + 500.0, us.y), base_damage=30.0,
+                  phase=BlastZonePhase.EXPANSION, age=1.0, current_radius=3.0, owner="ship_a"),
+    ]
+
+    user_prompt = adapter._build_prompt(mock_game_state, "ship_a")[1]["content"]
+
+    assert "BLAST ZONES (2 active):" in user_prompt
+    assert "- ship_b_torp_1_blast (ENEMY):" in user_prompt
+    assert "- ship_a_torp_1_blast (YOUR):" in user_prompt
+    assert "Damage rate: 2.00/second" in user_prompt
+    assert user_prompt.count("YOU ARE INSIDE THIS BLAST ZONE") == 1
+
+
+def test_user_prompt_splits_torpedoes_by_owner(adapter, mock_game_state):
+    """Verify own and enemy torpedoes are listed under separate headings."""
+    mock_game_state.torpedoes = [
+        TorpedoState(id=f"{owner}_torpedo_{i}", position=Vec2D(0.0, 0.0), velocity=Vec2D(0.0, 0.0),
+                     heading=0.0, ae_remaining=40, owner=owner)
+        for i, owner in enumerate(["ship_a", "ship_b", "ship_a"])
+    ]
+
+    user_prompt = adapter._build_prompt(mock_game_state, "ship_b")[1]["content"]
+    ours, _, theirs = user_prompt.partition("ENEMY TORPEDOES")
+
+    assert "YOUR TORPEDOES (1/4):" in ours
+    assert "ship_b_torpedo_1" in ours and "ship_a_torpedo_0" not in ours
+    assert theirs.startswith(" (2):")
+    assert "ship_a_torpedo_0" in theirs and "ship_a_torpedo_2" in theirs
+
+
+@pytest.mark.asyncio
+async def test_both_prompts_share_one_torpedo_partition(adapter, mock_game_state, monkeypatch):
+    """Verify get_orders_for_both_ships splits torpedoes once for both prompts."""
+    import ai_arena.llm_adapter.adapter as adapter_module
+
+    mock_game_state.torpedoes = [
+        TorpedoState(id=f"{owner}_torpedo_1", position=Vec2D(0.0, 0.0), velocity=Vec2D(0.0, 0.0),
+                     heading=0.0, ae_remaining=40, owner=owner)
+        for owner in ["ship_a", "ship_b"]
+    ]
+    partitions = []
+    original = adapter_module.partition_torpedoes
+    monkeypatch.setattr(
+        adapter_module, "partition_torpedoes",
+        lambda state: partitions.append(state) or original(state)
+    )
+    prompts = {}
+
+    async def fake_acompletion(model, messages, **kwargs):
+        prompts[messages[1]["content"].split("YOUR STATUS (")[1][:6]] = messages[1]["content"]
+        raise RuntimeError("no network in tests")
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    await adapter.get_orders_for_both_ships(mock_game_state)
+
+    assert len(partitions) == 1
+    assert "YOUR TORPEDOES (1/4):\n- ship_a_torpedo_1" in prompts["ship_a"]
+    assert "YOUR TORPEDOES (1/4):\n- ship_b_torpedo_1" in prompts["ship_b"]
+
+
+def test_response_format_uses_schema_when_supported(config, monkeypatch):
+    """Verify schema-capable models get the orders JSON Schema, others JSON mode."""
+    monkeypatch.setattr(litellm, "supports_response_schema", lambda model: model == "gpt-4o")
+
+    adapter = LLMAdapter("gpt-4o", "groq/llama3-8b-8192", config)
+
+    schema_format = adapter._response_formats["gpt-4o"]
+    assert schema_format["type"] == "json_schema"
+    assert schema_format["json_schema"]["schema"] is ORDERS_RESPONSE_SCHEMA
+    assert adapter._response_formats["groq/llama3-8b-8192"] == {"type": "json_object"}
+
+
+def test_orders_response_schema_matches_enums():
+    """Verify the response schema enumerates exactly the valid commands."""
+    properties = ORDERS_RESPONSE_SCHEMA["properties"]
+
+    assert set(properties["ship_movement"]["enum"]) == {m.value for m in MovementDirection}
+    assert set(properties["ship_rotation"]["enum"]) == {r.value for r in RotationCommand}
+
+
 # ============= Story 009: Order Parsing Tests =============
 
 def test_parse_orders_with_movement_and_rotation(adapter, mock_game_state):
@@ -230,6 +337,14 @@ def test_default_orders_on_parse_failure(adapter, mock_game_state):
     assert "ERROR" in thinking
 
 
+def test_malformed_json_reported_as_parse_error(adapter, mock_game_state):
+    """Decode errors from either JSON backend take the JSON parse error path."""
+    orders, thinking = adapter._parse_orders('{"ship_movement": ', mock_game_state, "ship_a")
+
+    assert orders.movement == MovementDirection.STOP
+    assert thinking == "JSON PARSE ERROR"
+
+
 def test_default_orders_on_empty_response(adapter, mock_game_state):
     """Empty JSON should return default orders."""
     response_json = '{}'
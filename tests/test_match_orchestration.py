@@ -11,12 +11,32 @@ Tests the complete match flow without requiring API keys:
 
 import pytest
 import asyncio
+import functools
+import json
+from pathlib import Path
+from ai_arena.orchestrator import match_orchestrator
 from ai_arena.orchestrator.match_orchestrator import MatchOrchestrator
+from ai_arena.replay.recorder import ReplayRecorder
 from ai_arena.config import ConfigLoader
 from tests.mocks import MockLLMAdapter, TacticalStrategy
 from tests.mocks.mock_llm_adapter import create_scripted_orders
 
 
+@pytest.fixture(autouse=True)
+def replay_dir(tmp_path, monkeypatch):
+    """Write match replays to a temporary directory instead of ./replays."""
+    monkeypatch.setattr(
+        match_orchestrator, "ReplayRecorder",
+        functools.partial(ReplayRecorder, replay_dir=tmp_path)
+    )
+    return tmp_path
+
+
+def load_turns(result):
+    """Read the recorded turns back from a finished match's replay file."""
+    return json.loads(Path(result['replay_path']).read_text())['turns']
+
+
 class TestMatchOrchestrationBasics:
     """Test basic match orchestration functionality."""
 
@@ -49,8 +69,8 @@ class TestMatchOrchestrationBasics:
         assert result['total_turns'] == 5
 
         # Verify replay was recorded
-        assert 'turns' in result
-        assert len(result['turns']) == 5
+        assert 'turns' not in result
+        assert len(load_turns(result)) == 5
 
     @pytest.mark.asyncio
     async def test_match_with_aggressive_vs_defensive_strategy(self):
@@ -192,7 +212,7 @@ class TestTacticalStrategies:
 
         # Verify strafing happened (check replay for LEFT/RIGHT movements)
         turns_with_strafe = 0
-        for turn in result['turns']:
+        for turn in load_turns(result):
             if turn['orders_a']['movement'] in ['LEFT', 'RIGHT']:
                 turns_with_strafe += 1
 
@@ -219,7 +239,7 @@ class TestTacticalStrategies:
         # Verify drifting happened (mostly LEFT movements)
         left_movements = 0
         soft_rotations = 0
-        for turn in result['turns']:
+        for turn in load_turns(result):
             if turn['orders_a']['movement'] == 'LEFT':
                 left_movements += 1
             if turn['orders_a']['rotation'] in ['SOFT_LEFT', 'SOFT_RIGHT', 'NONE']:
@@ -255,11 +275,11 @@ class TestReplaySystem:
         result = await orchestrator.run_match(max_turns=3)
 
         # Verify replay structure
-        assert 'turns' in result
-        assert len(result['turns']) == 3
+        turns = load_turns(result)
+        assert len(turns) == 3
 
         # Verify each turn has required fields
-        for i, turn in enumerate(result['turns']):
+        for i, turn in enumerate(turns):
             assert 'turn' in turn
             assert turn['turn'] == i + 1
             assert 'state' in turn  # State BEFORE orders applied
@@ -285,7 +305,7 @@ class TestReplaySystem:
         result = await orchestrator.run_match(max_turns=3)
 
         # Verify thinking is recorded
-        for turn in result['turns']:
+        for turn in load_turns(result):
             assert turn['thinking_a'] is not None
             assert turn['thinking_b'] is not None
             assert len(turn['thinking_a']) > 0
@@ -295,6 +315,33 @@ class TestReplaySystem:
             assert 'DEFENSIVE' in turn['thinking_b']
 
 
+    @pytest.mark.asyncio
+    async def test_failed_match_leaves_no_partial_replay(self, replay_dir):
+        """A match that raises mid-way closes and removes its partial replay."""
+        config = ConfigLoader().load("config.json")
+        mock_adapter = MockLLMAdapter(config, strategy_a=TacticalStrategy.BALANCED,
+                                      strategy_b=TacticalStrategy.BALANCED)
+        orchestrator = MatchOrchestrator("failing-a", "failing-b")
+        orchestrator.llm_adapter = mock_adapter
+
+        resolve_turn = orchestrator.physics_engine.resolve_turn
+        calls = []
+
+        def fail_on_second_turn(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("physics failure")
+            return resolve_turn(*args)
+
+        orchestrator.physics_engine.resolve_turn = fail_on_second_turn
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.run_match(max_turns=5)
+
+        assert orchestrator.replay_recorder._replay_file is None
+        assert list(replay_dir.iterdir()) == []
+
+
 class TestDeterminism:
     """Test that mock matches are deterministic."""
 
@@ -328,8 +375,8 @@ class TestDeterminism:
         assert results[0]['total_turns'] == results[1]['total_turns']
 
         # Verify final ship states are identical
-        final_turn_0 = results[0]['turns'][-1]
-        final_turn_1 = results[1]['turns'][-1]
+        final_turn_0 = load_turns(results[0])[-1]
+        final_turn_1 = load_turns(results[1])[-1]
 
         # Can't directly compare entire state due to dict ordering,
         # but can compare key metrics
@@ -366,12 +413,12 @@ class TestMixedModes:
         assert result['status'] == 'completed'
 
         # Verify ship A followed script (all FORWARD)
-        for turn in result['turns']:
+        for turn in load_turns(result):
             assert turn['orders_a']['movement'] == 'FORWARD'
             assert turn['orders_a']['rotation'] == 'HARD_LEFT'
 
         # Verify ship B adapted (strafe master alternates LEFT/RIGHT)
-        movements_b = [turn['orders_b']['movement'] for turn in result['turns']]
+        movements_b = [turn['orders_b']['movement'] for turn in load_turns(result)]
         # Should have both LEFT and RIGHT movements
         assert 'LEFT' in movements_b or 'RIGHT' in movements_b
 
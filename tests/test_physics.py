@@ -346,5 +346,237 @@ def test_angle_wrapping(engine):
     assert 0.0 <= state.ship_a.heading < 2 * np.pi, f"Heading {state.ship_a.heading} not in [0, 2π)"
 
 
+def test_ae_rate_tables_match_config(engine, config):
+    """Precomputed AE rate tables cover every command and mirror config."""
+    assert set(engine.MOVEMENT_AE_RATES) == set(MovementDirection)
+    assert set(engine.ROTATION_AE_RATES) == set(RotationCommand)
+
+    assert engine._get_movement_ae_rate(MovementDirection.FORWARD) == config.movement.forward_ae_per_second
+    assert engine._get_movement_ae_rate(MovementDirection.BACKWARD_RIGHT) == config.movement.backward_diagonal_ae_per_second
+    assert engine._get_rotation_ae_rate(RotationCommand.HARD_LEFT) == config.rotation.hard_turn_ae_per_second
+
+    orders = Orders(movement=MovementDirection.FORWARD, rotation=RotationCommand.HARD_LEFT,
+                    weapon_action="MAINTAIN_CONFIG")
+    assert engine._total_ae_cost(orders) == pytest.approx(
+        (config.movement.forward_ae_per_second + config.rotation.hard_turn_ae_per_second)
+        * config.simulation.decision_interval_seconds
+    )
+
+    assert engine.ROTATION_RATES_RAD[RotationCommand.SOFT_RIGHT] == pytest.approx(
+        -np.radians(config.rotation.soft_turn_degrees_per_second)
+    )
+
+
+def test_lookup_tables_hold_python_floats(engine):
+    """Angle tables are plain floats so NumPy scalars never reach headings."""
+    for table in (engine.MOVEMENT_DIRECTION_OFFSETS, engine.ROTATION_RATES_RAD,
+                  engine.TORPEDO_ROTATION_ANGLES):
+        assert all(type(value) is float for value in table.values())
+
+
+def test_phaser_params_match_config(engine, config):
+    """Per-config phaser tables carry arc cosine, squared range, damage, cooldown."""
+    for phaser_config, params in ((PhaserConfig.WIDE, config.phaser.wide),
+                                  (PhaserConfig.FOCUSED, config.phaser.focused)):
+        arc_cos, range_sq, damage, cooldown = engine.PHASER_PARAMS[phaser_config]
+        assert arc_cos == pytest.approx(np.cos(np.radians(params.arc_degrees) / 2))
+        assert range_sq == pytest.approx(params.range_units ** 2)
+        assert damage == params.damage
+        assert cooldown == params.cooldown_seconds
+
+
+@pytest.mark.parametrize("heading", [0.0, 1.0, 3.0, 2 * np.pi - 0.05])
+@pytest.mark.parametrize("offset_degrees,hits", [(0.0, True), (44.0, True), (-44.0, True),
+                                                 (46.0, False), (-46.0, False), (180.0, False)])
+def test_phaser_arc_test_across_headings(engine, heading, offset_degrees, hits):
+    """The projection arc test agrees with the 90° wide arc at any heading, including wrap-around."""
+    bearing = heading + np.radians(offset_degrees)
+    state = create_test_state(
+        ship_a_heading=heading,
+        ship_a_position=Vec2D(100.0, 100.0),
+        ship_b_position=Vec2D(100.0 + 20.0 * np.cos(bearing), 100.0 + 20.0 * np.sin(bearing)),
+        ship_b_cooldown=5.0,
+    )
+
+    events = engine._check_phaser_hits(state)
+
+    assert [e.data["attacker"] for e in events] == (["ship_a"] if hits else [])
+
+
+@pytest.mark.parametrize("heading,hits", [(0.0, True), (np.radians(44.0), True), (np.radians(-44.0), True),
+                                          (np.radians(46.0), False), (np.pi / 2, False), (np.pi, False)])
+def test_phaser_overlapping_ships_use_zero_bearing(engine, heading, hits):
+    """At zero distance the target bearing is 0, as atan2(0, 0) gave: only headings near +X hit."""
+    state = create_test_state(
+        ship_a_heading=heading,
+        ship_a_position=Vec2D(100.0, 100.0),
+        ship_b_position=Vec2D(100.0, 100.0),
+        ship_b_cooldown=5.0,
+    )
+
+    events = engine._check_phaser_hits(state)
+
+    assert [e.data["attacker"] for e in events] == (["ship_a"] if hits else [])
+
+
+def test_blast_lifecycle_constants_match_config(engine, config):
+    """Blast phase breakpoints and radius rates are derived from config."""
+    torpedo = config.torpedo
+    assert engine.blast_expansion_end == torpedo.blast_expansion_seconds
+    assert engine.blast_persistence_end == pytest.approx(
+        torpedo.blast_expansion_seconds + torpedo.blast_persistence_seconds
+    )
+    assert engine.blast_growth_rate * torpedo.blast_expansion_seconds == pytest.approx(torpedo.blast_radius_units)
+    assert engine.blast_shrink_rate * torpedo.blast_dissipation_seconds == pytest.approx(torpedo.blast_radius_units)
+
+
+@pytest.mark.parametrize("movement", list(MovementDirection))
+@pytest.mark.parametrize("rotation", [RotationCommand.NONE, RotationCommand.HARD_LEFT, RotationCommand.SOFT_RIGHT])
+def test_analytic_ship_motion_matches_substeps(config, movement, rotation):
+    """Closed-form ship integration reproduces the per-substep path."""
+    from ai_arena.game_engine.data_models import BlastZone, BlastZonePhase
+
+    def run(use_analytic):
+        state = create_test_state(ship_a_heading=0.3, ship_a_ae=12.0, ship_a_cooldown=2.0)
+        # Zone just ahead of ship A, so damage depends on its intermediate positions
+        state.blast_zones.append(BlastZone(
+            id="zone", position=Vec2D(120.0, 105.0), base_damage=30.0,
+            phase=BlastZonePhase.PERSISTENCE, age=10.0, current_radius=15.0, owner="ship_b"
+        ))
+        orders = Orders(movement=movement, rotation=rotation, weapon_action="MAINTAIN_CONFIG")
+        engine = PhysicsEngine(config, use_analytic=use_analytic)
+        return engine.resolve_turn(state, orders, get_default_orders_b())
+
+    (analytic, analytic_events), (stepped, stepped_events) = run(True), run(False)
+
+    for ship_id in ("ship_a", "ship_b"):
+        a, s = getattr(analytic, ship_id), getattr(stepped, ship_id)
+        assert a.position.x == pytest.approx(s.position.x, abs=1e-9)
+        assert a.position.y == pytest.approx(s.position.y, abs=1e-9)
+        assert a.velocity.x == pytest.approx(s.velocity.x, abs=1e-9)
+        assert a.velocity.y == pytest.approx(s.velocity.y, abs=1e-9)
+        assert a.heading == pytest.approx(s.heading, abs=1e-9)
+        assert a.ae == pytest.approx(s.ae, abs=1e-9)
+        assert a.shields == pytest.approx(s.shields, abs=1e-9)
+        assert a.phaser_cooldown_remaining == pytest.approx(s.phaser_cooldown_remaining, abs=1e-9)
+    assert len(analytic_events) == len(stepped_events)
+
+
+@pytest.mark.parametrize("movement", list(MovementDirection))
+@pytest.mark.parametrize("rotation", list(RotationCommand))
+def test_closed_form_ship_endpoint_matches_path(engine, movement, rotation):
+    """With or without intermediate positions, the final state is identical."""
+    orders = Orders(movement=movement, rotation=rotation, weapon_action="MAINTAIN_CONFIG")
+    with_path = create_test_state(ship_a_heading=0.3).ship_a
+    endpoint = create_test_state(ship_a_heading=0.3).ship_a
+
+    xs, ys = engine._integrate_ship_motion(with_path, orders, engine.fixed_timestep)
+    (x,), (y,) = engine._integrate_ship_motion(endpoint, orders, engine.fixed_timestep, path=False)
+
+    assert len(xs) == len(ys) == engine.substeps
+    assert (x, y) == (xs[-1], ys[-1])
+    assert endpoint.heading == with_path.heading
+    assert endpoint.velocity == with_path.velocity
+
+
+@pytest.mark.parametrize("rotation", [RotationCommand.NONE, RotationCommand.HARD_LEFT])
+def test_unrelated_blast_zone_does_not_change_ship_motion(engine, rotation):
+    """A far-away blast zone switches on the substep loop without moving the ships."""
+    from ai_arena.game_engine.data_models import BlastZone, BlastZonePhase
+
+    orders = Orders(movement=MovementDirection.FORWARD, rotation=rotation, weapon_action="MAINTAIN_CONFIG")
+    quiet = create_test_state(ship_a_heading=0.3)
+    busy = create_test_state(ship_a_heading=0.3)
+    busy.blast_zones.append(BlastZone(
+        id="zone", position=Vec2D(-900.0, -900.0), base_damage=30.0,
+        phase=BlastZonePhase.PERSISTENCE, age=10.0, current_radius=15.0, owner="ship_b"
+    ))
+
+    quiet_state, _ = engine.resolve_turn(quiet, orders, get_default_orders_b())
+    busy_state, _ = engine.resolve_turn(busy, orders, get_default_orders_b())
+
+    for ship_id in ("ship_a", "ship_b"):
+        q, b = getattr(quiet_state, ship_id), getattr(busy_state, ship_id)
+        assert (q.position, q.velocity, q.heading, q.ae) == (b.position, b.velocity, b.heading, b.ae)
+
+
+def test_analytic_torpedo_motion_matches_substeps(config):
+    """Batched torpedo integration reproduces per-substep flight and detonations."""
+    from ai_arena.game_engine.data_models import TorpedoState
+
+    def run(use_analytic):
+        torpedoes = [
+            TorpedoState(id="ship_a_torpedo_1", position=Vec2D(300.0, 100.0), velocity=Vec2D(4.0, 0.0),
+                         heading=0.0, ae_remaining=40.0, owner="ship_a"),
+            TorpedoState(id="ship_a_torpedo_2", position=Vec2D(300.0, 300.0), velocity=Vec2D(0.0, 4.0),
+                         heading=6.2, ae_remaining=0.6, owner="ship_a"),
+            TorpedoState(id="ship_b_torpedo_1", position=Vec2D(500.0, 200.0), velocity=Vec2D(-4.0, 0.0),
+                         heading=np.pi, ae_remaining=30.0, owner="ship_b"),
+        ]
+        state = create_test_state(torpedoes=torpedoes)
+        orders_a = Orders(
+            movement=MovementDirection.STOP, rotation=RotationCommand.NONE, weapon_action="LAUNCH_TORPEDO",
+            torpedo_orders={"ship_a_torpedo_1": "HARD_LEFT", "ship_a_torpedo_2": "SOFT_LEFT"}
+        )
+        orders_b = Orders(
+            movement=MovementDirection.STOP, rotation=RotationCommand.NONE, weapon_action="MAINTAIN_CONFIG",
+            torpedo_orders={"ship_b_torpedo_1": "detonate_after:3.0"}
+        )
+        engine = PhysicsEngine(config, use_analytic=use_analytic)
+        return engine.resolve_turn(state, orders_a, orders_b)
+
+    (analytic, analytic_events), (stepped, stepped_events) = run(True), run(False)
+
+    assert [e.type for e in analytic_events] == [e.type for e in stepped_events]
+    assert [z.id for z in analytic.blast_zones] == [z.id for z in stepped.blast_zones]
+    for a, s in zip(analytic.blast_zones, stepped.blast_zones):
+        assert a.position.x == pytest.approx(s.position.x, abs=1e-9)
+        assert a.position.y == pytest.approx(s.position.y, abs=1e-9)
+        assert a.base_damage == pytest.approx(s.base_damage, abs=1e-9)
+        assert a.current_radius == pytest.approx(s.current_radius, abs=1e-9)
+
+    assert [t.id for t in analytic.torpedoes] == [t.id for t in stepped.torpedoes]
+    for a, s in zip(analytic.torpedoes, stepped.torpedoes):
+        assert a.position.x == pytest.approx(s.position.x, abs=1e-9)
+        assert a.position.y == pytest.approx(s.position.y, abs=1e-9)
+        assert a.heading == pytest.approx(s.heading, abs=1e-9)
+        assert a.ae_remaining == pytest.approx(s.ae_remaining, abs=1e-9)
+        assert a.detonation_timer == s.detonation_timer
+
+
+def test_quiet_turn_skips_substep_loop(config, monkeypatch):
+    """Without blast zones or detonations the analytic path never enters the loop."""
+    engine = PhysicsEngine(config)
+    calls = []
+    monkeypatch.setattr(engine, "_update_blast_zones", lambda zones, dt: calls.append(dt))
+    orders = Orders(movement=MovementDirection.FORWARD, rotation=RotationCommand.SOFT_LEFT,
+                    weapon_action="MAINTAIN_CONFIG")
+
+    state, _ = engine.resolve_turn(create_test_state(), orders, get_default_orders_b())
+    stepped, _ = PhysicsEngine(config, use_analytic=False).resolve_turn(
+        create_test_state(), orders, get_default_orders_b()
+    )
+
+    assert calls == []
+    assert state.ship_a.position.x == pytest.approx(stepped.ship_a.position.x, abs=1e-9)
+    assert state.ship_a.position.y == pytest.approx(stepped.ship_a.position.y, abs=1e-9)
+    assert state.ship_a.ae == pytest.approx(stepped.ship_a.ae, abs=1e-9)
+
+
+def test_reference_path_skips_empty_collection_passes(config, monkeypatch):
+    """The substepped path skips blast-zone and detonation passes with nothing to update."""
+    engine = PhysicsEngine(config, use_analytic=False)
+    calls = []
+    monkeypatch.setattr(engine, "_update_blast_zones", lambda zones, dt: calls.append("zones"))
+    monkeypatch.setattr(engine, "_handle_torpedo_detonations", lambda s, e, dt: calls.append("torpedoes"))
+
+    orders = Orders(movement=MovementDirection.FORWARD, rotation=RotationCommand.NONE,
+                    weapon_action="MAINTAIN_CONFIG")
+
+    engine.resolve_turn(create_test_state(), orders, get_default_orders_b())
+
+    assert calls == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
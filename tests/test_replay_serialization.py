@@ -149,7 +149,7 @@ class TestFullReplaySerialization:
     def test_full_replay_includes_torpedo_timers(self, tmp_path):
         """Full replay recording should preserve torpedo detonation timers."""
         # Create recorder
-        recorder = ReplayRecorder("gpt-4", "claude-3-haiku")
+        recorder = ReplayRecorder("gpt-4", "claude-3-haiku", replay_dir=tmp_path)
 
         # Create a turn with torpedoes
         torpedo_with_timer = TorpedoState(
@@ -213,12 +213,13 @@ class TestFullReplaySerialization:
 
         # Finalize and check structure
         match_data = recorder.finalize("ship_a", 1)
+        replay = json.loads(Path(match_data["replay_path"]).read_text())
 
         # Verify structure
-        assert "turns" in match_data
-        assert len(match_data["turns"]) == 1
+        assert "turns" not in match_data
+        assert len(replay["turns"]) == 1
 
-        turn_data = match_data["turns"][0]
+        turn_data = replay["turns"][0]
         assert "state" in turn_data
         assert "torpedoes" in turn_data["state"]
         assert len(turn_data["state"]["torpedoes"]) == 1
@@ -230,7 +231,7 @@ class TestFullReplaySerialization:
 
     def test_replay_json_structure_includes_timer(self, tmp_path):
         """Verify replay JSON structure includes detonation_timer field."""
-        recorder = ReplayRecorder("model_a", "model_b")
+        recorder = ReplayRecorder("model_a", "model_b", replay_dir=tmp_path)
 
         # Create simple state with torpedo
         state = GameState(
@@ -275,9 +276,10 @@ class TestFullReplaySerialization:
         )
 
         recorder.record_turn(1, state, orders_a, orders_a, "thinking", "thinking", [])
+        recorder.finalize("tie", 1)
 
         # Get the turn data
-        turn_data = recorder.turns[0]
+        turn_data = json.loads(recorder.replay_path.read_text())["turns"][0]
 
         # Verify JSON structure
         assert turn_data["state"]["torpedoes"][0]["detonation_timer"] == 2.5
@@ -289,6 +291,110 @@ class TestFullReplaySerialization:
         assert parsed["state"]["torpedoes"][0]["detonation_timer"] == 2.5
 
 
+class TestStreamedReplayFile:
+    """Test that turns streamed to disk produce a normal replay file."""
+
+    def test_streamed_file_matches_returned_data(self, tmp_path, monkeypatch):
+        """The finished file parses as one JSON document and loads by match_id."""
+        from ai_arena.replay.recorder import ReplayLoader
+
+        monkeypatch.chdir(tmp_path)
+        recorder = ReplayRecorder("model_a", "model_b")
+
+        ship = ShipState(
+            position=Vec2D(50.0, 50.0),
+            velocity=Vec2D(0.0, 0.0),
+            heading=0.0,
+            shields=100,
+            ae=100,
+            phaser_config=PhaserConfig.WIDE,
+            reconfiguring_phaser=False
+        )
+        orders = Orders(
+            movement=MovementDirection.STOP,
+            rotation=RotationCommand.NONE,
+            weapon_action="MAINTAIN_CONFIG",
+            torpedo_orders={}
+        )
+        for turn in (1, 2):
+            state = GameState(turn=turn, ship_a=ship, ship_b=ship)
+            recorder.record_turn(turn, state, orders, orders, "a", "b", [])
+
+        # Only the in-progress file exists until the match is finalized
+        assert not recorder.replay_path.exists()
+        assert recorder.turn_count == 2
+        assert not hasattr(recorder, "turns")
+
+        match_data = recorder.finalize("tie", 2)
+
+        assert list(Path("replays").iterdir()) == [recorder.replay_path]
+        assert match_data["replay_path"] == str(recorder.replay_path)
+        on_disk = json.loads(recorder.replay_path.read_text())
+        assert {k: v for k, v in on_disk.items() if k != "turns"} == {
+            k: v for k, v in match_data.items() if k != "replay_path"
+        }
+        assert [t["turn"] for t in on_disk["turns"]] == [1, 2]
+        assert ReplayLoader.load(recorder.match_id) == on_disk
+
+    def test_replay_without_turns_is_valid_json(self, tmp_path):
+        """Finalizing before any turn still writes a complete JSON object."""
+        recorder = ReplayRecorder("model_a", "model_b", replay_dir=tmp_path)
+
+        match_data = recorder.finalize("tie", 0)
+
+        on_disk = json.loads(recorder.replay_path.read_text())
+        assert on_disk["match_id"] == match_data["match_id"]
+        assert on_disk["turns"] == []
+        assert on_disk["models"] == {"ship_a": "model_a", "ship_b": "model_b"}
+
+    def test_abort_discards_partial_file(self, tmp_path):
+        """abort() closes and removes an unfinished replay and is safe to repeat."""
+        recorder = ReplayRecorder("model_a", "model_b", replay_dir=tmp_path)
+        ship = ShipState(
+            position=Vec2D(50.0, 50.0),
+            velocity=Vec2D(0.0, 0.0),
+            heading=0.0,
+            shields=100,
+            ae=100,
+            phaser_config=PhaserConfig.WIDE
+        )
+        orders = Orders(
+            movement=MovementDirection.STOP,
+            rotation=RotationCommand.NONE,
+            weapon_action="MAINTAIN_CONFIG"
+        )
+        recorder.record_turn(1, GameState(turn=1, ship_a=ship, ship_b=ship), orders, orders, "a", "b", [])
+        assert len(list(tmp_path.iterdir())) == 1
+
+        recorder.abort()
+        recorder.abort()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_abort_after_finalize_keeps_replay(self, tmp_path):
+        """abort() after finalize() leaves the finished replay in place."""
+        recorder = ReplayRecorder("model_a", "model_b", replay_dir=tmp_path)
+        ship = ShipState(
+            position=Vec2D(50.0, 50.0),
+            velocity=Vec2D(0.0, 0.0),
+            heading=0.0,
+            shields=100,
+            ae=100,
+            phaser_config=PhaserConfig.WIDE
+        )
+        orders = Orders(
+            movement=MovementDirection.STOP,
+            rotation=RotationCommand.NONE,
+            weapon_action="MAINTAIN_CONFIG"
+        )
+        recorder.record_turn(1, GameState(turn=1, ship_a=ship, ship_b=ship), orders, orders, "a", "b", [])
+        recorder.finalize("tie", 1)
+
+        recorder.abort()
+
+        assert list(tmp_path.iterdir()) == [recorder.replay_path]
+
+
 class TestBackwardCompatibility:
     """Test that replays work with or without detonation_timer field."""
 
@@ -59,6 +59,11 @@ class TestParseTorpedoAction:
         with pytest.raises(ValueError, match="outside valid range"):
             parse_torpedo_action("detonate_after:16.0")
 
+    def test_parse_detonate_invalid_delay_nan(self):
+        """Verify a NaN delay raises ValueError."""
+        with pytest.raises(ValueError, match="outside valid range"):
+            parse_torpedo_action("detonate_after:nan")
+
     def test_parse_detonate_invalid_format(self):
         """Verify invalid format raises ValueError."""
         with pytest.raises(ValueError, match="Invalid detonation delay format"):
@@ -170,7 +175,7 @@ class TestDeepCopyGameState:
 
         # Modify original
         original.ship_a.shields = 50.0
-        original.ship_a.position.x = 999.0
+        original.ship_a.position = Vec2D(999.0, 0.0)
 
         # Verify copied state is unchanged
         assert copied.ship_a.shields == 100.0
@@ -271,3 +276,59 @@ class TestDeepCopyGameState:
         # Verify independence
         original.blast_zones[0].current_radius = 15.0
         assert copied.blast_zones[0].current_radius == 10.0
+
+    def test_deep_copy_equals_original(self):
+        """Verify every field survives the copy: containers are copied, immutable vectors shared."""
+        original = GameState(
+            turn=7,
+            ship_a=ShipState(
+                position=Vec2D(1.0, 2.0),
+                velocity=Vec2D(3.0, 4.0),
+                heading=0.5,
+                shields=80.0,
+                ae=40.0,
+                phaser_config=PhaserConfig.FOCUSED,
+                reconfiguring_phaser=True,
+                phaser_cooldown_remaining=1.5
+            ),
+            ship_b=ShipState(
+                position=Vec2D(100.0, 0.0),
+                velocity=Vec2D(0.0, 0.0),
+                heading=3.0,
+                shields=100.0,
+                ae=100.0,
+                phaser_config=PhaserConfig.WIDE
+            ),
+            torpedoes=[
+                TorpedoState(
+                    id="ship_a_torpedo_1",
+                    owner="ship_a",
+                    position=Vec2D(10.0, 10.0),
+                    velocity=Vec2D(15.0, 0.0),
+                    heading=0.0,
+                    ae_remaining=30.0,
+                    just_launched=True,
+                    detonation_timer=4.0
+                )
+            ],
+            blast_zones=[
+                BlastZone(
+                    id="blast_1",
+                    owner="ship_b",
+                    position=Vec2D(50.0, 50.0),
+                    base_damage=45.0,
+                    current_radius=10.0,
+                    phase=BlastZonePhase.PERSISTENCE,
+                    age=20.0
+                )
+            ]
+        )
+
+        copied = deep_copy_game_state(original)
+
+        assert copied == original
+        assert copied.ship_a is not original.ship_a
+        assert copied.torpedoes[0] is not original.torpedoes[0]
+        assert copied.blast_zones[0] is not original.blast_zones[0]
+        # Vec2D is immutable, so vectors are shared rather than copied
+        assert copied.ship_a.position is original.ship_a.position